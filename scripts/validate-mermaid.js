@@ -8,8 +8,23 @@
  */
 
 const fs = require('fs').promises;
+const os = require('os');
 const path = require('path');
-const { execSync } = require('child_process');
+const crypto = require('crypto');
+const { spawn, execSync } = require('child_process');
+
+// Each mmdc render is an independent external process, so run several at once
+const MAX_CONCURRENT_RENDERS = Math.max(1, os.cpus().length);
+
+// Successfully rendered diagrams are cached by content hash so unchanged
+// diagrams skip the mmdc (Node + headless Chromium) startup on later runs
+const CACHE_DIR = path.join(__dirname, '..', '.cache', 'mermaid');
+
+// Fenced Mermaid block, compiled once for every markdown file
+const MERMAID_BLOCK_REGEX = /```mermaid\n([\s\S]*?)```/g;
+
+// Written after a fully valid run; lets an unchanged tree skip the scan
+const STAMP_FILE = path.join(CACHE_DIR, 'last-valid-run');
 
 // ANSI color codes for output
 const colors = {
@@ -24,15 +39,22 @@ const colors = {
  * Extract Mermaid diagrams from markdown content
  */
 function extractMermaidDiagrams(content, filename) {
-  const mermaidRegex = /```mermaid\n([\s\S]*?)```/g;
   const diagrams = [];
-  let match;
   
-  while ((match = mermaidRegex.exec(content)) !== null) {
-    const lines = content.substring(0, match.index).split('\n');
+  // Count newlines incrementally from the previous match instead of
+  // re-splitting the whole prefix for every diagram
+  let line = 1;
+  let scanned = 0;
+  
+  for (const match of content.matchAll(MERMAID_BLOCK_REGEX)) {
+    for (let i = scanned; i < match.index; i++) {
+      if (content.charCodeAt(i) === 10) line++;
+    }
+    scanned = match.index;
+    
     diagrams.push({
       content: match[1],
-      lineNumber: lines.length + 1,
+      lineNumber: line + 1,
       filename
     });
   }
@@ -40,39 +62,157 @@ function extractMermaidDiagrams(content, filename) {
   return diagrams;
 }
 
+let mmdcVersion;
+
 /**
- * Validate a single Mermaid diagram
+ * Get the installed mmdc version (captured once per process)
  */
-async function validateDiagram(diagram, index) {
-  const tempFile = path.join(__dirname, `temp_diagram_${index}.mmd`);
-  const outputFile = path.join(__dirname, `temp_diagram_${index}.svg`);
+function getMmdcVersion() {
+  if (mmdcVersion === undefined) {
+    // Read the package manifest rather than spawning `npx mmdc --version`,
+    // which costs a full Node startup
+    try {
+      mmdcVersion = require('@mermaid-js/mermaid-cli/package.json').version;
+    } catch (error) {
+      try {
+        mmdcVersion = execSync('npx mmdc --version', { stdio: 'pipe' }).toString().trim();
+      } catch (error) {
+        mmdcVersion = 'unknown';
+      }
+    }
+  }
+  return mmdcVersion;
+}
+
+/**
+ * Compute the content-addressed cache key for a diagram.
+ * The key only has to tell diagrams apart, so SHA-1 is enough; the one-shot
+ * crypto.hash() is used where the Node version provides it.
+ */
+function getCacheKey(diagram) {
+  const input = `${getMmdcVersion()}\0${diagram.content}`;
+  if (typeof crypto.hash === 'function') {
+    return crypto.hash('sha1', input);
+  }
+  return crypto.createHash('sha1').update(input).digest('hex');
+}
+
+let rendererPromise;
+
+/**
+ * Launch one headless browser shared by every render in this process.
+ * Resolves to null when the mermaid-cli Node API is unavailable, in which
+ * case diagrams fall back to a separate mmdc process each.
+ */
+function getRenderer() {
+  if (!rendererPromise) {
+    rendererPromise = (async () => {
+      try {
+        const [{ renderMermaid }, { default: puppeteer }] = await Promise.all([
+          import('@mermaid-js/mermaid-cli'),
+          import('puppeteer')
+        ]);
+        const browser = await puppeteer.launch({ headless: true });
+        return {
+          browser,
+          render: async content => (await renderMermaid(browser, content, 'svg')).data
+        };
+      } catch (error) {
+        return null;
+      }
+    })();
+  }
+  return rendererPromise;
+}
+
+/**
+ * Render a diagram in the shared browser straight into the cache
+ */
+async function renderInBrowser(renderer, diagram, cachePath) {
+  try {
+    const svg = await renderer.render(diagram.content);
+    await fs.mkdir(CACHE_DIR, { recursive: true });
+    await fs.writeFile(cachePath, svg);
+    
+    return { success: true, cached: false, diagram };
+  } catch (error) {
+    return { success: false, diagram, error: error.message };
+  }
+}
+
+/**
+ * Run mmdc with the diagram on stdin. Its stdout is discarded and only
+ * stderr is collected, to be decoded once if the render fails.
+ */
+function runMmdc(args, input) {
+  return new Promise((resolve, reject) => {
+    const child = spawn('npx', ['mmdc', ...args], { stdio: ['pipe', 'ignore', 'pipe'] });
+    const stderr = [];
+    
+    child.stderr.on('data', chunk => stderr.push(chunk));
+    child.on('error', reject);
+    child.on('close', code => {
+      if (code === 0) {
+        resolve();
+      } else {
+        const error = new Error(`mmdc exited with code ${code}`);
+        error.stderr = Buffer.concat(stderr);
+        reject(error);
+      }
+    });
+    
+    child.stdin.end(input);
+  });
+}
+
+/**
+ * Render a diagram with a standalone mmdc process
+ */
+async function renderWithMmdc(diagram, key, cachePath) {
+  // Feed the diagram over stdin and render next to its cache entry, so no
+  // temp .mmd file is written; the rename publishes the SVG atomically
+  const outputFile = path.join(CACHE_DIR, `${key}.tmp.svg`);
+  await fs.mkdir(CACHE_DIR, { recursive: true });
   
+  // Try to render the diagram
   try {
-    // Write diagram to temp file
-    await fs.writeFile(tempFile, diagram.content);
+    await runMmdc(['-i', '-', '-o', outputFile, '--quiet'], diagram.content);
+    
+    // Keep the successful render in the cache
+    await fs.rename(outputFile, cachePath);
+    
+    return { success: true, cached: false, diagram };
+  } catch (error) {
+    // Clean up failed output
+    await fs.unlink(outputFile).catch(() => {});
     
-    // Try to render the diagram
+    return { 
+      success: false, 
+      diagram,
+      error: error.stderr && error.stderr.length ? error.stderr.toString('utf-8') : error.message
+    };
+  }
+}
+
+/**
+ * Validate a single Mermaid diagram
+ */
+async function validateDiagram(diagram, key) {
+  try {
+    // Diagrams already rendered with this mmdc version are known to be valid
+    const cachePath = path.join(CACHE_DIR, `${key}.svg`);
     try {
-      execSync(`npx mmdc -i "${tempFile}" -o "${outputFile}" --quiet`, {
-        stdio: 'pipe'
-      });
-      
-      // Clean up successful render
-      await fs.unlink(tempFile).catch(() => {});
-      await fs.unlink(outputFile).catch(() => {});
-      
-      return { success: true, diagram };
+      await fs.access(cachePath);
+      return { success: true, cached: true, diagram };
     } catch (error) {
-      // Clean up failed files
-      await fs.unlink(tempFile).catch(() => {});
-      await fs.unlink(outputFile).catch(() => {});
-      
-      return { 
-        success: false, 
-        diagram,
-        error: error.stderr ? error.stderr.toString() : error.message
-      };
+      // Cache miss - fall through to render
+    }
+    
+    const renderer = await getRenderer();
+    if (renderer) {
+      return await renderInBrowser(renderer, diagram, cachePath);
     }
+    return await renderWithMmdc(diagram, key, cachePath);
   } catch (error) {
     return { 
       success: false, 
@@ -82,15 +222,41 @@ async function validateDiagram(diagram, index) {
   }
 }
 
+/**
+ * Map items through an async function with at most `limit` calls in flight
+ */
+async function mapWithConcurrency(items, limit, fn) {
+  const results = new Array(items.length);
+  let next = 0;
+  
+  async function worker() {
+    while (next < items.length) {
+      const index = next++;
+      results[index] = await fn(items[index], index);
+    }
+  }
+  
+  const workers = [];
+  for (let i = 0; i < Math.min(limit, items.length); i++) {
+    workers.push(worker());
+  }
+  await Promise.all(workers);
+  
+  return results;
+}
+
 /**
  * Find all markdown files in the project
  */
 async function findMarkdownFiles(dir, files = []) {
   const items = await fs.readdir(dir);
   
-  for (const item of items) {
+  // Stat entries concurrently, then walk them in directory order
+  const stats = await Promise.all(items.map(item => fs.stat(path.join(dir, item))));
+  
+  for (const [index, item] of items.entries()) {
     const fullPath = path.join(dir, item);
-    const stat = await fs.stat(fullPath);
+    const stat = stats[index];
     
     // Skip node_modules and hidden directories
     if (stat.isDirectory() && !item.startsWith('.') && item !== 'node_modules') {
@@ -103,6 +269,28 @@ async function findMarkdownFiles(dir, files = []) {
   return files;
 }
 
+/**
+ * Check whether nothing has changed since the last fully valid run:
+ * the stamp must be newer than every markdown file and this script, and
+ * must have been written for the installed mmdc version.
+ */
+async function isUpToDate(markdownFiles) {
+  try {
+    const [stamp, version] = await Promise.all([
+      fs.stat(STAMP_FILE),
+      fs.readFile(STAMP_FILE, 'utf-8')
+    ]);
+    if (version !== getMmdcVersion()) {
+      return false;
+    }
+    
+    const stats = await Promise.all([__filename, ...markdownFiles].map(file => fs.stat(file)));
+    return stats.every(stat => stat.mtimeMs < stamp.mtimeMs);
+  } catch (error) {
+    return false;
+  }
+}
+
 /**
  * Main validation function
  */
@@ -112,33 +300,66 @@ async function main() {
   const projectRoot = path.join(__dirname, '..');
   const markdownFiles = await findMarkdownFiles(projectRoot);
   
-  let totalDiagrams = 0;
-  let failedDiagrams = 0;
-  const errors = [];
+  // Pass --force to re-check everything regardless of timestamps
+  if (!process.argv.includes('--force') && await isUpToDate(markdownFiles)) {
+    console.log(`${colors.green}✅ No markdown changes since the last valid run, skipping${colors.reset}`);
+    return;
+  }
+  
+  // Collect every diagram first so renders can be fanned out together
+  const sources = [];
+  const allDiagrams = [];
   
-  for (const file of markdownFiles) {
-    const content = await fs.readFile(file, 'utf-8');
+  // Read every file concurrently; results keep the discovery order
+  const contents = await Promise.all(markdownFiles.map(file => fs.readFile(file, 'utf-8')));
+  
+  markdownFiles.forEach((file, index) => {
+    const content = contents[index];
     const relativePath = path.relative(projectRoot, file);
     const diagrams = extractMermaidDiagrams(content, relativePath);
     
     if (diagrams.length > 0) {
-      console.log(`${colors.blue}📄 ${relativePath}${colors.reset} (${diagrams.length} diagram${diagrams.length > 1 ? 's' : ''})`);
-      
-      for (let i = 0; i < diagrams.length; i++) {
-        totalDiagrams++;
-        const result = await validateDiagram(diagrams[i], totalDiagrams);
-        
-        if (result.success) {
-          console.log(`  ${colors.green}✓${colors.reset} Diagram at line ${result.diagram.lineNumber}`);
-        } else {
-          failedDiagrams++;
-          console.log(`  ${colors.red}✗${colors.reset} Diagram at line ${result.diagram.lineNumber}`);
-          errors.push({
-            file: relativePath,
-            line: result.diagram.lineNumber,
-            error: result.error
-          });
-        }
+      sources.push({ relativePath, start: allDiagrams.length, count: diagrams.length });
+      allDiagrams.push(...diagrams);
+    }
+  });
+  
+  // Identical diagrams share one render
+  const renders = new Map();
+  const results = await mapWithConcurrency(allDiagrams, MAX_CONCURRENT_RENDERS, async diagram => {
+    const key = getCacheKey(diagram);
+    if (!renders.has(key)) {
+      renders.set(key, validateDiagram(diagram, key));
+    }
+    return { ...(await renders.get(key)), diagram };
+  });
+  
+  if (rendererPromise) {
+    const renderer = await rendererPromise;
+    if (renderer) {
+      await renderer.browser.close();
+    }
+  }
+  
+  const totalDiagrams = allDiagrams.length;
+  let failedDiagrams = 0;
+  const errors = [];
+  
+  for (const { relativePath, start, count } of sources) {
+    console.log(`${colors.blue}📄 ${relativePath}${colors.reset} (${count} diagram${count > 1 ? 's' : ''})`);
+    
+    for (const result of results.slice(start, start + count)) {
+      if (result.success) {
+        const note = result.cached ? ' (cached)' : '';
+        console.log(`  ${colors.green}✓${colors.reset} Diagram at line ${result.diagram.lineNumber}${note}`);
+      } else {
+        failedDiagrams++;
+        console.log(`  ${colors.red}✗${colors.reset} Diagram at line ${result.diagram.lineNumber}`);
+        errors.push({
+          file: relativePath,
+          line: result.diagram.lineNumber,
+          error: result.error
+        });
       }
     }
   }
@@ -156,6 +377,8 @@ async function main() {
     }
     process.exit(1);
   } else {
+    await fs.mkdir(CACHE_DIR, { recursive: true });
+    await fs.writeFile(STAMP_FILE, getMmdcVersion());
     console.log(`\n${colors.green}✅ All Mermaid diagrams are valid!${colors.reset}`);
   }
 }
@@ -1,13 +1,41 @@
 """Memory store for agent episodic and action history."""
 
 import json
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 import structlog
 
 logger = structlog.get_logger()
 
+# Last formatted timestamp and the millisecond it was formatted in
+_last_timestamp_ms = -1
+_last_timestamp = ""
+
+
+def utc_now_iso() -> str:
+    """
+    Get the current UTC time as a naive ISO 8601 string.
+    
+    The formatted string is reused for calls within the same millisecond,
+    so bursts of episodes and actions skip the datetime formatting.
+    
+    Returns:
+        Timestamp in the same format as ``datetime.utcnow().isoformat()``
+    """
+    global _last_timestamp_ms, _last_timestamp
+    now_ns = time.time_ns()
+    now_ms = now_ns // 1_000_000
+    if now_ms != _last_timestamp_ms:
+        _last_timestamp = (
+            datetime.fromtimestamp(now_ns / 1e9, tz=timezone.utc)
+            .replace(tzinfo=None)
+            .isoformat()
+        )
+        _last_timestamp_ms = now_ms
+    return _last_timestamp
+
 
 class MemoryStore:
     """In-memory store for agent episodes and actions."""
@@ -26,12 +54,13 @@ class MemoryStore:
         Args:
             episode: Episode data including prompt, plan, context
         """
-        episode["timestamp"] = episode.get("timestamp", datetime.utcnow().isoformat())
+        if "timestamp" not in episode:
+            episode["timestamp"] = utc_now_iso()
         self.episodes.append(episode)
         
-        # Maintain max size
+        # Maintain max size, trimming in place rather than copying the list
         if len(self.episodes) > self.max_episodes:
-            self.episodes = self.episodes[-self.max_episodes:]
+            del self.episodes[:-self.max_episodes]
         
         logger.debug("Episode added to memory", episode_id=episode.get("id"))
     
@@ -42,12 +71,13 @@ class MemoryStore:
         Args:
             action: Action data including type, params, result
         """
-        action["timestamp"] = action.get("timestamp", datetime.utcnow().isoformat())
+        if "timestamp" not in action:
+            action["timestamp"] = utc_now_iso()
         self.actions.append(action)
         
         # Maintain reasonable size
         if len(self.actions) > self.max_episodes * 10:
-            self.actions = self.actions[-(self.max_episodes * 10):]
+            del self.actions[:-(self.max_episodes * 10)]
         
         logger.debug("Action added to memory", action_type=action.get("action"))
     
@@ -1,6 +1,7 @@
 """Agent orchestrator for planning and executing Legend operations."""
 
 import json
+import time
 import uuid
 from datetime import datetime
 from typing import Any, Dict, List, Optional
@@ -8,13 +9,11 @@ from typing import Any, Dict, List, Optional
 import structlog
 import yaml
 
-from legend_guardian.agent.memory import MemoryStore
+from legend_guardian.agent.memory import MemoryStore, utc_now_iso
 from legend_guardian.agent.policies import PolicyEngine
 from legend_guardian.agent.llm_client import LLMClient
 from legend_guardian.rag.store import VectorStore
-from legend_guardian.clients.depot import DepotClient
-from legend_guardian.clients.engine import EngineClient
-from legend_guardian.clients.sdlc import SDLCClient
+from legend_guardian.clients.shared import get_legend_clients
 from legend_guardian.config import Settings
 
 logger = structlog.get_logger()
@@ -23,13 +22,60 @@ logger = structlog.get_logger()
 class AgentOrchestrator:
     """Orchestrates agent operations across Legend services."""
     
+    # Actions that only read workspace/depot state. Adjacent read-only steps
+    # of a plan can run concurrently; any other step is a barrier.
+    _READ_ONLY_ACTIONS = frozenset({
+        "compile",
+        "search_depot",
+        "transform_schema",
+        "run_tests",
+        "analyze_table",
+    })
+    
+    # Action name -> handler method name, resolved per step with getattr
+    _HANDLER_NAMES = {
+        "create_workspace": "_create_workspace",
+        "create_model": "_create_model",
+        "create_mapping": "_create_mapping",
+        "compile": "_compile",
+        "generate_service": "_generate_service",
+        "open_review": "_open_review",
+        "search_depot": "_search_depot",
+        "import_model": "_import_model",
+        "transform_schema": "_transform_schema",
+        "run_tests": "_run_tests",
+        "publish": "_publish",
+        # Phase 2: Model Management
+        "apply_changes": "_apply_changes",
+        "create_v2_service": "_create_v2_service",
+        "create_service": "_create_service",
+        # Phase 3: Data Operations
+        "analyze_table": "_analyze_table",
+        "generate_model": "_generate_model",
+        "add_constraints": "_add_constraints",
+        "plan_ingestion": "_plan_ingestion",
+        "execute_backfill": "_execute_backfill",
+        "validate_sample": "_validate_sample",
+        "record_manifest": "_record_manifest",
+    }
+    
+    # PURE constraint templates for _generate_pure_from_schema
+    _SCHEMA_CONSTRAINTS = {
+        "qtyPositive": "  constraint qtyPositive: $this.quantity > 0;",
+        "validTicker": "  constraint validTicker: $this.ticker->isNotEmpty();",
+    }
+    
     def __init__(self, settings: Settings):
         """Initialize orchestrator."""
         self.settings = settings
-        self.engine_client = EngineClient(settings)
-        self.sdlc_client = SDLCClient(settings)
-        self.depot_client = DepotClient(settings)
-        self.memory = MemoryStore()
+        
+        # Reuse the process-wide clients so their connection pools survive
+        # across orchestrator instances
+        clients = get_legend_clients(settings)
+        self.engine_client = clients.engine
+        self.sdlc_client = clients.sdlc
+        self.depot_client = clients.depot
+        self.memory = MemoryStore(max_episodes=settings.agent_memory_max_episodes)
         self.policy_engine = PolicyEngine()
         
         # Initialize LLM client if configured
@@ -67,7 +113,7 @@ class AgentOrchestrator:
                     "prompt": prompt,
                     "plan": steps,
                     "context": context,
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": utc_now_iso(),
                 })
                 
                 return steps
@@ -81,7 +127,7 @@ class AgentOrchestrator:
         if "create" in prompt_lower and "model" in prompt_lower:
             steps.append({
                 "action": "create_model",
-                "params": self._extract_model_params(prompt),
+                "params": self._extract_model_params(prompt_lower),
             })
         
         if "compile" in prompt_lower:
@@ -117,7 +163,7 @@ class AgentOrchestrator:
             "prompt": prompt,
             "plan": steps,
             "context": context,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": utc_now_iso(),
         })
         
         return steps
@@ -140,35 +186,10 @@ class AgentOrchestrator:
         logger.info("Executing step", action=action, params=params)
         
         # Route to appropriate handler
-        handlers = {
-            "create_workspace": self._create_workspace,
-            "create_model": self._create_model,
-            "create_mapping": self._create_mapping,
-            "compile": self._compile,
-            "generate_service": self._generate_service,
-            "open_review": self._open_review,
-            "search_depot": self._search_depot,
-            "import_model": self._import_model,
-            "transform_schema": self._transform_schema,
-            "run_tests": self._run_tests,
-            "publish": self._publish,
-            # Phase 2: Model Management
-            "apply_changes": self._apply_changes,
-            "create_v2_service": self._create_v2_service,
-            "create_service": self._create_service,
-            # Phase 3: Data Operations
-            "analyze_table": self._analyze_table,
-            "generate_model": self._generate_model,
-            "add_constraints": self._add_constraints,
-            "plan_ingestion": self._plan_ingestion,
-            "execute_backfill": self._execute_backfill,
-            "validate_sample": self._validate_sample,
-            "record_manifest": self._record_manifest,
-        }
-        
-        handler = handlers.get(action)
-        if not handler:
+        handler_name = self._HANDLER_NAMES.get(action)
+        if handler_name is None:
             raise ValueError(f"Unknown action: {action}")
+        handler = getattr(self, handler_name)
         
         # Apply pre-execution policies
         await self.policy_engine.check_action(action, params)
@@ -181,11 +202,43 @@ class AgentOrchestrator:
             "action": action,
             "params": params,
             "result": result,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": utc_now_iso(),
         })
         
         return result
     
+    def plan_waves(self, steps: List[Dict[str, Any]]) -> List[List[int]]:
+        """
+        Group plan steps into waves that can run concurrently.
+        
+        Adjacent read-only steps share a wave. Steps that change state, or
+        that require approval, get a wave of their own, so they see the
+        effects of every earlier step.
+        
+        Args:
+            steps: Planned steps with 'action' and optional 'requires_approval'
+        
+        Returns:
+            Step indices per wave, in plan order
+        """
+        waves: List[List[int]] = []
+        wave: List[int] = []
+        
+        for i, step in enumerate(steps):
+            if step["action"] in self._READ_ONLY_ACTIONS and not step.get("requires_approval"):
+                wave.append(i)
+                continue
+            
+            if wave:
+                waves.append(wave)
+                wave = []
+            waves.append([i])
+        
+        if wave:
+            waves.append(wave)
+        
+        return waves
+    
     async def validate_step(
         self,
         action: str,
@@ -451,8 +504,12 @@ class AgentOrchestrator:
                     "errors": [{"message": "No entities found in workspace"}],
                 }
             
-            # Step 2: Convert entities to PURE code
+            # Step 2: Convert entities to PURE code. The engine takes the
+            # source as one JSON field, so it cannot be streamed; instead the
+            # entity list is released before the compile request is awaited.
+            entity_count = len(entities)
             pure_code = self._entities_to_pure(entities)
+            del entities
             
             if not pure_code:
                 return {
@@ -472,7 +529,7 @@ class AgentOrchestrator:
                 "status": "success" if result.get("status") == "success" else "failed",
                 "errors": result.get("errors", []),
                 "warnings": result.get("warnings", []),
-                "entity_count": len(entities),
+                "entity_count": entity_count,
                 "pure_size": len(pure_code),
             }
             
@@ -1024,7 +1081,7 @@ class AgentOrchestrator:
         # Track execution metrics
         processed = 0
         failed = 0
-        start_time = datetime.utcnow()
+        start_time = time.monotonic()
         errors = []
         
         # Process windows (simulated)
@@ -1048,8 +1105,10 @@ class AgentOrchestrator:
                 failed += window.get("record_count", 0)
                 errors.append(str(e))
         
+        # Durations come from the monotonic clock; wall time is only needed
+        # for the completion timestamp
+        duration = time.monotonic() - start_time
         end_time = datetime.utcnow()
-        duration = (end_time - start_time).total_seconds()
         
         # Generate summary
         success_rate = (processed / (processed + failed) * 100) if (processed + failed) > 0 else 0
@@ -1146,14 +1205,14 @@ class AgentOrchestrator:
     
     # Helper methods
     
-    def _extract_model_params(self, prompt: str) -> Dict[str, Any]:
-        """Extract model parameters from prompt."""
+    def _extract_model_params(self, prompt_lower: str) -> Dict[str, Any]:
+        """Extract model parameters from an already lowercased prompt."""
         # Simple extraction logic
         params = {"name": "Model"}
         
-        if "trade" in prompt.lower():
+        if "trade" in prompt_lower:
             params["name"] = "Trade"
-        elif "position" in prompt.lower():
+        elif "position" in prompt_lower:
             params["name"] = "Position"
         
         return params
@@ -1169,93 +1228,83 @@ class AgentOrchestrator:
         
         return params
     
+    def _parse_csv_header(self, csv_data: str) -> List[str]:
+        """Get the column names from the first line of CSV data."""
+        # Only the header line is needed, so never split the rows
+        header = csv_data.lstrip().partition("\n")[0]
+        return [name.strip() for name in header.split(",")]
+    
     def _generate_pure_from_csv(self, model_name: str, csv_data: str) -> str:
         """Generate PURE model from CSV."""
         # Simple CSV to PURE conversion
-        lines = csv_data.strip().split("\n")
-        if not lines:
-            return f"Class {model_name} {{}}"
-        
-        headers = lines[0].split(",") if lines else []
-        
-        properties = []
-        for header in headers:
-            prop_name = header.strip()
-            properties.append(f"  {prop_name}: String[1];")
-        
-        pure = f"""Class model::{model_name}
-{{
-{chr(10).join(properties)}
-}}"""
+        properties = "\n".join(
+            f"  {prop_name}: String[1];" for prop_name in self._parse_csv_header(csv_data)
+        )
         
-        return pure
+        return f"Class model::{model_name}\n{{\n{properties}\n}}"
     
     def _extract_properties_from_csv(self, csv_data: str) -> List[Dict[str, Any]]:
         """Extract properties from CSV."""
-        lines = csv_data.strip().split("\n")
-        if not lines:
-            return []
-        
-        headers = lines[0].split(",") if lines else []
-        
-        properties = []
-        for header in headers:
-            prop_name = header.strip()
-            properties.append({
+        return [
+            {
                 "name": prop_name,
                 "type": "String",
                 "multiplicity": {"lowerBound": 1, "upperBound": 1},
-            })
-        
-        return properties
+            }
+            for prop_name in self._parse_csv_header(csv_data)
+        ]
     
     def _entities_to_pure(self, entities: List[Dict[str, Any]]) -> str:
         """Convert entities to PURE code."""
-        pure_parts = []
+        # Every line of every element goes into one list that is joined once
+        lines: List[str] = []
         
         for entity in entities:
             classifier = entity.get("classifierPath", "")
             content = entity.get("content", {})
             
             if "Class" in classifier:
-                pure_parts.append(self._class_to_pure(content))
+                emit = self._emit_class
             elif "Mapping" in classifier:
-                pure_parts.append(self._mapping_to_pure(content))
-            # Add more conversions as needed
+                emit = self._emit_mapping
+            else:
+                # Add more conversions as needed
+                continue
+            
+            if lines:
+                lines.append("")  # Blank line between elements
+            emit(content, lines)
         
-        return "\n\n".join(pure_parts)
+        return "\n".join(lines)
     
-    def _class_to_pure(self, content: Dict[str, Any]) -> str:
-        """Convert class to PURE."""
+    def _emit_class(self, content: Dict[str, Any], lines: List[str]) -> None:
+        """Append the PURE lines of a class to lines."""
         name = content.get("name", "UnknownClass")
         package = content.get("package", "model")
         properties = content.get("properties", [])
         
-        prop_lines = []
+        lines.append(f"Class {package}::{name}")
+        lines.append("{")
+        
         for prop in properties:
-            prop_name = prop.get("name")
-            prop_type = prop.get("type", "String")
             mult = prop.get("multiplicity", {})
             lower = mult.get("lowerBound", 1)
             upper = mult.get("upperBound", 1)
-            
-            mult_str = f"[{lower}..{upper}]" if upper != "*" else f"[{lower}..*]"
-            prop_lines.append(f"  {prop_name}: {prop_type}{mult_str};")
+            lines.append(f"  {prop.get('name')}: {prop.get('type', 'String')}[{lower}..{upper}];")
         
-        return f"""Class {package}::{name}
-{{
-{chr(10).join(prop_lines)}
-}}"""
+        if not properties:
+            lines.append("")
+        lines.append("}")
     
-    def _mapping_to_pure(self, content: Dict[str, Any]) -> str:
-        """Convert mapping to PURE."""
+    def _emit_mapping(self, content: Dict[str, Any], lines: List[str]) -> None:
+        """Append the PURE lines of a mapping to lines."""
         name = content.get("name", "UnknownMapping")
         package = content.get("package", "mapping")
         
-        return f"""Mapping {package}::{name}
-(
-  // Mapping implementation
-)"""
+        lines.append(f"Mapping {package}::{name}")
+        lines.append("(")
+        lines.append("  // Mapping implementation")
+        lines.append(")")
     
     # Phase 3: Data Operations Helper Methods
     
@@ -1311,36 +1360,21 @@ class AgentOrchestrator:
         constraints: List[str] = None,
     ) -> str:
         """Generate PURE code from database schema."""
-        properties = []
-        
-        for column in columns:
-            col_name = column.get("name", "")
-            col_type = column.get("type", "VARCHAR")
-            nullable = column.get("nullable", True)
-            
-            # Map SQL types to PURE types
-            pure_type = self._sql_to_pure_type(col_type)
-            multiplicity = "[0..1]" if nullable else "[1]"
-            
-            properties.append(f"  {col_name}: {pure_type}{multiplicity};")
-        
-        # Add constraints if provided
-        constraint_lines = []
-        if constraints:
-            for constraint in constraints:
-                if constraint == "qtyPositive":
-                    constraint_lines.append("  constraint qtyPositive: $this.quantity > 0;")
-                elif constraint == "validTicker":
-                    constraint_lines.append("  constraint validTicker: $this.ticker->isNotEmpty();")
-                # Add more constraint patterns as needed
+        # Map SQL types to PURE types; nullable columns are optional
+        property_lines = "\n".join(
+            f"  {column.get('name', '')}: {self._sql_to_pure_type(column.get('type', 'VARCHAR'))}"
+            f"{'[0..1]' if column.get('nullable', True) else '[1]'};"
+            for column in columns
+        )
         
-        pure = f"""Class model::{model_name}
-{{
-{chr(10).join(properties)}
-{chr(10).join(constraint_lines) if constraint_lines else ''}
-}}"""
+        # Add constraints if provided; unknown names are skipped
+        constraint_lines = "\n".join(
+            self._SCHEMA_CONSTRAINTS[constraint]
+            for constraint in constraints or ()
+            if constraint in self._SCHEMA_CONSTRAINTS
+        )
         
-        return pure
+        return f"Class model::{model_name}\n{{\n{property_lines}\n{constraint_lines}\n}}"
     
     def _sql_to_pure_type(self, sql_type: str) -> str:
         """Map SQL types to PURE types."""
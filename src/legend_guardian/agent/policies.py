@@ -1,16 +1,52 @@
 """Policy engine for guardrails and compliance."""
 
+import copy
+import os
 import re
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Pattern, Tuple
 
 import structlog
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 logger = structlog.get_logger()
 
+# Leaf types that cannot carry PII; entity payloads are full of them
+_SCALAR_TYPES = frozenset({int, float, bool, type(None)})
+
+# Parsed policy files keyed by absolute path, with the mtime they were read at
+_policy_file_cache: Dict[str, Tuple[float, Any]] = {}
+
 
 class PolicyEngine:
-    """Enforces policies and guardrails on agent actions."""
+    """
+    Enforces policies and guardrails on agent actions.
+    
+    Regex and action-list policies are compiled when the engine is built.
+    Change them through update_policy(); editing self.policies directly does
+    not take effect until _compile_policies() runs again.
+    """
+    
+    # Action -> (naming rule, checked parameter, label for the error message)
+    _NAMING_CHECKS = {
+        "create_workspace": ("workspace", "workspace_id", "Workspace ID"),
+        "create_model": ("model", "name", "Model name"),
+        "generate_service": ("service", "path", "Service path"),
+    }
+    
+    # Policies that _compile_policies turns into patterns or sets
+    _COMPILED_POLICY_KEYS = frozenset({
+        "pii_patterns",
+        "naming_rules",
+        "prohibited_actions",
+        "require_approval",
+        "allowed_schema_types",
+    })
     
     def __init__(self, policy_file: str = None):
         """Initialize policy engine."""
@@ -18,6 +54,8 @@ class PolicyEngine:
         
         if policy_file:
             self._load_policies_from_file(policy_file)
+        
+        self._compile_policies()
     
     def _load_default_policies(self) -> Dict[str, Any]:
         """Load default policies."""
@@ -43,12 +81,71 @@ class PolicyEngine:
     def _load_policies_from_file(self, policy_file: str) -> None:
         """Load policies from YAML file."""
         try:
-            with open(policy_file, "r") as f:
-                custom_policies = yaml.safe_load(f)
-                self.policies.update(custom_policies)
+            path = os.path.abspath(policy_file)
+            try:
+                mtime = os.stat(path).st_mtime
+            except OSError:
+                mtime = None
+            
+            cached = _policy_file_cache.get(path)
+            if mtime is not None and cached is not None and cached[0] == mtime:
+                custom_policies = cached[1]
+            else:
+                with open(policy_file, "r") as f:
+                    custom_policies = yaml.load(f, Loader=_YamlLoader)
+                if mtime is not None:
+                    _policy_file_cache[path] = (mtime, custom_policies)
+            
+            # Copy so engines never share mutable policy values
+            self.policies.update(copy.deepcopy(custom_policies))
         except Exception as e:
             logger.error(f"Failed to load policy file: {e}")
     
+    def _compile_policies(self) -> None:
+        """Compile regex policies once so every check reuses the patterns."""
+        # Compile each pattern on its own so an invalid one fails by itself,
+        # then fuse them so each string is scanned once where that is safe
+        self._pii_patterns = [re.compile(pattern) for pattern in self.policies.get("pii_patterns", [])]
+        self._pii_pattern = self._join_patterns(self._pii_patterns)
+        # Strings such as packages, classifiers and property names repeat
+        # across plan validation and execution; remember recent verdicts.
+        # Rebuilt here, so the cache is dropped whenever patterns change.
+        self._contains_pii = lru_cache(maxsize=1024)(self._search_pii)
+        self._naming_patterns = {
+            name: re.compile(pattern)
+            for name, pattern in self.policies.get("naming_rules", {}).items()
+            if pattern
+        }
+        # Membership tests run per plan step; keep hashed copies of the lists
+        self._prohibited_actions = frozenset(self.policies.get("prohibited_actions", []))
+        self._approval_actions = frozenset(self.policies.get("require_approval", []))
+        self._allowed_schema_types = frozenset(self.policies.get("allowed_schema_types", []))
+    
+    @staticmethod
+    def _join_patterns(patterns: List[Pattern]) -> Optional[Pattern]:
+        """
+        Fuse patterns into one alternation when that keeps their meaning.
+        
+        Args:
+            patterns: Compiled patterns
+        
+        Returns:
+            The fused pattern, or None to search pattern by pattern
+        """
+        if not patterns:
+            return None
+        
+        # Group numbers shift once patterns are joined, so numbered
+        # backreferences would point at the wrong group
+        if any(pattern.groups for pattern in patterns):
+            return None
+        
+        try:
+            return re.compile("|".join(f"(?:{pattern.pattern})" for pattern in patterns))
+        except re.error:
+            # e.g. a leading inline flag such as (?i), only valid at the start
+            return None
+    
     async def validate_plan(
         self,
         steps: List[Dict[str, Any]],
@@ -69,12 +166,12 @@ class PolicyEngine:
             params = step.get("params", {})
             
             # Check if action is prohibited
-            if action in self.policies.get("prohibited_actions", []):
+            if action in self._prohibited_actions:
                 logger.warning(f"Prohibited action removed from plan: {action}")
                 continue
             
             # Check if action requires approval
-            if action in self.policies.get("require_approval", []):
+            if action in self._approval_actions:
                 step["requires_approval"] = True
             
             # Validate parameters
@@ -107,23 +204,13 @@ class PolicyEngine:
         self._check_pii(params)
         
         # Check naming conventions
-        if action == "create_workspace":
-            workspace_id = params.get("workspace_id", "")
-            pattern = self.policies["naming_rules"].get("workspace")
-            if pattern and not re.match(pattern, workspace_id):
-                raise ValueError(f"Workspace ID '{workspace_id}' violates naming policy")
-        
-        elif action == "create_model":
-            model_name = params.get("name", "")
-            pattern = self.policies["naming_rules"].get("model")
-            if pattern and not re.match(pattern, model_name):
-                raise ValueError(f"Model name '{model_name}' violates naming policy")
-        
-        elif action == "generate_service":
-            service_path = params.get("path", "")
-            pattern = self.policies["naming_rules"].get("service")
-            if pattern and not re.match(pattern, service_path):
-                raise ValueError(f"Service path '{service_path}' violates naming policy")
+        naming_check = self._NAMING_CHECKS.get(action)
+        if naming_check:
+            rule, param, label = naming_check
+            value = params.get(param, "")
+            pattern = self._naming_patterns.get(rule)
+            if pattern and not pattern.match(value):
+                raise ValueError(f"{label} '{value}' violates naming policy")
         
         elif action == "open_review":
             title = params.get("title", "")
@@ -139,8 +226,7 @@ class PolicyEngine:
         
         elif action == "transform_schema":
             schema_type = params.get("format", "")
-            allowed = self.policies.get("allowed_schema_types", [])
-            if schema_type not in allowed:
+            if schema_type not in self._allowed_schema_types:
                 raise ValueError(f"Schema type '{schema_type}' not allowed")
     
     def _check_pii(self, data: Any) -> None:
@@ -153,21 +239,40 @@ class PolicyEngine:
         Raises:
             ValueError: If PII detected
         """
-        patterns = self.policies.get("pii_patterns", [])
-        
-        def check_value(value: Any):
-            if isinstance(value, str):
-                for pattern in patterns:
-                    if re.search(pattern, value):
-                        raise ValueError("PII detected in parameters")
+        if not self._pii_patterns:
+            return
+        
+        contains_pii = self._contains_pii
+        
+        # Walk nested params with an explicit stack instead of recursion
+        stack = [data]
+        while stack:
+            value = stack.pop()
+            # Exact type checks first: most leaves are plain str/int/bool/None
+            value_type = type(value)
+            if value_type is dict:
+                stack.extend(value.values())
+            elif value_type is str:
+                if contains_pii(value):
+                    raise ValueError("PII detected in parameters")
+            elif value_type is list:
+                stack.extend(value)
+            elif value_type in _SCALAR_TYPES:
+                continue
+            # Subclasses such as OrderedDict or str-based enums
+            elif isinstance(value, str):
+                if contains_pii(value):
+                    raise ValueError("PII detected in parameters")
             elif isinstance(value, dict):
-                for v in value.values():
-                    check_value(v)
+                stack.extend(value.values())
             elif isinstance(value, list):
-                for item in value:
-                    check_value(item)
-        
-        check_value(data)
+                stack.extend(value)
+    
+    def _search_pii(self, text: str) -> bool:
+        """Check whether a single string matches any PII pattern."""
+        if self._pii_pattern is not None:
+            return self._pii_pattern.search(text) is not None
+        return any(pattern.search(text) for pattern in self._pii_patterns)
     
     def redact_pii(self, text: str) -> str:
         """
@@ -179,11 +284,11 @@ class PolicyEngine:
         Returns:
             Redacted text
         """
-        patterns = self.policies.get("pii_patterns", [])
-        
-        for pattern in patterns:
-            text = re.sub(pattern, "[REDACTED]", text)
+        if self._pii_pattern is not None:
+            return self._pii_pattern.sub("[REDACTED]", text)
         
+        for pattern in self._pii_patterns:
+            text = pattern.sub("[REDACTED]", text)
         return text
     
     def check_compile_result(
@@ -263,4 +368,8 @@ class PolicyEngine:
             value: New policy value
         """
         self.policies[key] = value
+        
+        if key in self._COMPILED_POLICY_KEYS:
+            self._compile_policies()
+        
         logger.info(f"Policy updated: {key}")
\ No newline at end of file
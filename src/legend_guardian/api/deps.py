@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
-from typing import Annotated, Optional
+import re
+import time
+from typing import Annotated, Dict, Optional, Tuple
 
 import structlog
 from fastapi import Depends, HTTPException, Header, Request, Security
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from legend_guardian.clients.depot import DepotClient
+from legend_guardian.clients.engine import EngineClient
+from legend_guardian.clients.sdlc import SDLCClient
+from legend_guardian.clients.shared import get_legend_clients
 from legend_guardian.config import Settings, get_settings
 
 logger = structlog.get_logger()
@@ -59,44 +65,60 @@ async def get_workspace_id(
     return workspace_id or settings.workspace_id
 
 
+async def get_depot_client(
+    settings: Annotated[Settings, Depends(get_settings)],
+) -> DepotClient:
+    """Get the shared Depot client, so its connection pool outlives the request."""
+    return get_legend_clients(settings).depot
+
+
+async def get_engine_client(
+    settings: Annotated[Settings, Depends(get_settings)],
+) -> EngineClient:
+    """Get the shared Engine client, so its connection pool outlives the request."""
+    return get_legend_clients(settings).engine
+
+
+async def get_sdlc_client(
+    settings: Annotated[Settings, Depends(get_settings)],
+) -> SDLCClient:
+    """Get the shared SDLC client, so its connection pool outlives the request."""
+    return get_legend_clients(settings).sdlc
+
+
 # Alias for RateLimiter to use
 verify_api_key = get_api_key
 
 
 class RateLimiter:
-    """Simple rate limiter dependency."""
+    """Token-bucket rate limiter dependency."""
     
     def __init__(self, max_requests: int = 100, window_seconds: int = 60):
         """Initialize rate limiter."""
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.requests = {}
+        self.refill_rate = max_requests / window_seconds
+        # API key -> (available tokens, monotonic time of last refill)
+        self.requests: Dict[str, Tuple[float, float]] = {}
     
     async def __call__(self, request: Request, api_key: str = Depends(verify_api_key)):
         """Check rate limit."""
-        import time
-        
-        now = time.time()
+        now = time.monotonic()
         
-        # Clean old entries
-        self.requests = {
-            k: v for k, v in self.requests.items() 
-            if now - v["timestamp"] < self.window_seconds
-        }
+        # Refill only this key's bucket; keys are limited to the valid API
+        # keys, so the table never needs sweeping
+        tokens, last = self.requests.get(api_key, (self.max_requests, now))
+        tokens = min(self.max_requests, tokens + (now - last) * self.refill_rate)
         
-        # Check rate limit
-        if api_key in self.requests:
-            entry = self.requests[api_key]
-            if entry["count"] >= self.max_requests:
-                logger.warning("Rate limit exceeded", api_key_prefix=api_key[:8])
-                raise HTTPException(
-                    status_code=429,
-                    detail=f"Rate limit exceeded: {self.max_requests} requests per {self.window_seconds} seconds"
-                )
-            entry["count"] += 1
-        else:
-            self.requests[api_key] = {"count": 1, "timestamp": now}
+        if tokens < 1:
+            self.requests[api_key] = (tokens, now)
+            logger.warning("Rate limit exceeded", api_key_prefix=api_key[:8])
+            raise HTTPException(
+                status_code=429,
+                detail=f"Rate limit exceeded: {self.max_requests} requests per {self.window_seconds} seconds"
+            )
         
+        self.requests[api_key] = (tokens - 1, now)
         return api_key
 
 
@@ -114,18 +136,16 @@ class PIIRedactor:
         r"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b",  # Phone number
     ]
     
+    # All patterns fused into one alternation so text is scanned once
+    _PATTERN = re.compile("|".join(f"(?:{pattern})" for pattern in PATTERNS))
+    
     @classmethod
     def redact(cls, text: str) -> str:
         """Redact PII from text."""
-        import re
-        
         if not text:
             return text
         
-        for pattern in cls.PATTERNS:
-            text = re.sub(pattern, "[REDACTED]", text)
-        
-        return text
+        return cls._PATTERN.sub("[REDACTED]", text)
 
 
 async def get_pii_redactor(
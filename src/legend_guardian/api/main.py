@@ -1,8 +1,12 @@
 """FastAPI main application."""
 
+import logging
+import queue
 import time
+import uuid
 from contextlib import asynccontextmanager
-from typing import Any, Dict
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, List, Tuple
 
 import structlog
 from fastapi import FastAPI, Request
@@ -26,6 +30,8 @@ from legend_guardian.api.routers import (
     intent,
     webhooks,
 )
+from legend_guardian.api.routers.health import close_health_client, get_health_client, reset_readiness_cache
+from legend_guardian.clients.shared import close_legend_clients
 from legend_guardian.config import settings
 
 # Configure structured logging
@@ -56,9 +62,77 @@ structlog.configure(
 logger = structlog.get_logger()
 
 
+# Loggers whose handlers are moved behind a queue. Our structlog output
+# goes through the root logger; under uvicorn the handlers that actually
+# write sit on its own loggers instead.
+_QUEUED_LOGGERS = ("", "uvicorn", "uvicorn.error", "uvicorn.access")
+
+
+class _PassThroughQueueHandler(QueueHandler):
+    """Queue records as they are, leaving formatting to the real handlers."""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Keep record.args intact.
+        
+        The default prepare() formats the message and clears args, but
+        uvicorn's AccessFormatter unpacks args itself. The queue never leaves
+        the process, so records need no pickling-safe preparation.
+        """
+        return record
+
+
+def start_log_listener() -> List[Tuple[logging.Logger, QueueListener]]:
+    """
+    Move the log handlers of the writing loggers behind queues.
+    
+    Request handlers then only enqueue records, and listener threads do
+    the blocking writes. Each logger gets its own queue so records keep
+    going to that logger's handlers only.
+    
+    Returns:
+        The started listeners with the loggers they serve; empty if no
+        logger had handlers
+    """
+    listeners = []
+    for name in _QUEUED_LOGGERS:
+        target = logging.getLogger(name)
+        handlers = list(target.handlers)
+        if not handlers:
+            continue
+        
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        for handler in handlers:
+            target.removeHandler(handler)
+        target.addHandler(_PassThroughQueueHandler(log_queue))
+        
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        listeners.append((target, listener))
+    
+    if not listeners:
+        # Nothing to move: records fall through to logging's last-resort
+        # handler, which still writes on the calling thread
+        logger.warning("Log queue listener inactive: no log handlers configured")
+    
+    return listeners
+
+
+def stop_log_listener(listeners: List[Tuple[logging.Logger, QueueListener]]) -> None:
+    """Flush queued records and give each logger its handlers back."""
+    for target, listener in listeners:
+        listener.stop()
+        for handler in list(target.handlers):
+            if isinstance(handler, QueueHandler) and handler.queue is listener.queue:
+                target.removeHandler(handler)
+        for handler in listener.handlers:
+            target.addHandler(handler)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
+    log_listeners = start_log_listener()
     logger.info("Starting Legend Guardian Agent", version=settings.app_version)
     
     # Initialize OpenTelemetry if enabled
@@ -69,9 +143,19 @@ async def lifespan(app: FastAPI):
     elif settings.otel_enabled and not _OTEL_AVAILABLE:
         logger.warning("OpenTelemetry enabled but not installed; skipping instrumentation")
     
+    # Pooled client for health probes, bound to this app's event loop
+    get_health_client(app)
+    
     yield
     
     logger.info("Shutting down Legend Guardian Agent")
+    try:
+        await close_legend_clients()
+        await close_health_client(app)
+        reset_readiness_cache(app)
+    finally:
+        # Always restore the original handlers, even if a close failed
+        stop_log_listener(log_listeners)
 
 
 # Create FastAPI application
@@ -97,44 +181,41 @@ app.add_middleware(
 
 @app.middleware("http")
 async def add_correlation_id(request: Request, call_next):
-    """Add correlation ID to all requests."""
-    correlation_id = request.headers.get("X-Correlation-ID", str(time.time()))
+    """Add correlation ID to all requests and log them."""
+    # Only generate an ID when the caller did not send one; a random UUID
+    # cannot collide between concurrent requests the way timestamps can
+    correlation_id = request.headers.get("X-Correlation-ID") or uuid.uuid4().hex
     request.state.correlation_id = correlation_id
     
+    # Correlation and request logging share one middleware so each request
+    # pays for a single ASGI hop
     with structlog.contextvars.bound_contextvars(correlation_id=correlation_id):
+        start_time = time.monotonic()
+        
+        # Log request
+        logger.info(
+            "Request started",
+            method=request.method,
+            path=request.url.path,
+            client=request.client.host if request.client else None,
+        )
+        
         response = await call_next(request)
+        
+        # Log response
+        duration = time.monotonic() - start_time
+        logger.info(
+            "Request completed",
+            method=request.method,
+            path=request.url.path,
+            status_code=response.status_code,
+            duration_ms=round(duration * 1000, 2),
+        )
+        
         response.headers["X-Correlation-ID"] = correlation_id
         return response
 
 
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """Log all incoming requests."""
-    start_time = time.time()
-    
-    # Log request
-    logger.info(
-        "Request started",
-        method=request.method,
-        path=request.url.path,
-        client=request.client.host if request.client else None,
-    )
-    
-    response = await call_next(request)
-    
-    # Log response
-    duration = time.time() - start_time
-    logger.info(
-        "Request completed",
-        method=request.method,
-        path=request.url.path,
-        status_code=response.status_code,
-        duration_ms=round(duration * 1000, 2),
-    )
-    
-    return response
-
-
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler."""
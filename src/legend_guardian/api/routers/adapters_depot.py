@@ -6,11 +6,10 @@ from typing import Any, Dict, List, Optional
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, Body
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
-from legend_guardian.api.deps import get_correlation_id, verify_api_key
+from legend_guardian.api.deps import get_correlation_id, get_depot_client, verify_api_key
 from legend_guardian.clients.depot import DepotClient
-from legend_guardian.config import Settings, get_settings
 
 router = APIRouter()
 logger = structlog.get_logger()
@@ -37,13 +36,18 @@ class DepotEntity(BaseModel):
     version: str
 
 
+# Validate whole responses with one compiled validator each
+_projects_adapter = TypeAdapter(List[DepotProject])
+_entities_adapter = TypeAdapter(List[DepotEntity])
+
+
 @router.get("/search")
 async def search_depot(
     q: str = Query(..., description="Search query"),
     limit: int = Query(20, description="Maximum results"),
     api_key: str = Depends(verify_api_key),
     correlation_id: str = Depends(get_correlation_id),
-    settings: Settings = Depends(get_settings),
+    client: DepotClient = Depends(get_depot_client),
 ) -> List[Dict[str, Any]]:
     """
     Search the depot for models.
@@ -58,7 +62,6 @@ async def search_depot(
     )
     
     try:
-        client = DepotClient(settings=settings)
         results = await client.search(
             query=q,
             limit=limit,
@@ -75,7 +78,7 @@ async def search_depot(
 async def list_depot_projects(
     api_key: str = Depends(verify_api_key),
     correlation_id: str = Depends(get_correlation_id),
-    settings: Settings = Depends(get_settings),
+    client: DepotClient = Depends(get_depot_client),
 ) -> List[DepotProject]:
     """
     List all depot projects.
@@ -85,10 +88,9 @@ async def list_depot_projects(
     logger.info("Listing depot projects", correlation_id=correlation_id)
     
     try:
-        client = DepotClient(settings=settings)
         projects = await client.list_projects()
         
-        return [DepotProject(**p) for p in projects]
+        return _projects_adapter.validate_python(projects)
         
     except Exception as e:
         logger.error("Failed to list depot projects", error=str(e))
@@ -100,7 +102,7 @@ async def get_depot_project(
     project_id: str = Path(..., description="Project ID"),
     api_key: str = Depends(verify_api_key),
     correlation_id: str = Depends(get_correlation_id),
-    settings: Settings = Depends(get_settings),
+    client: DepotClient = Depends(get_depot_client),
 ) -> Dict[str, Any]:
     """Get depot project details."""
     logger.info(
@@ -110,7 +112,6 @@ async def get_depot_project(
     )
     
     try:
-        client = DepotClient(settings=settings)
         project = await client.get_project(project_id)
         
         return project
@@ -125,7 +126,7 @@ async def list_project_versions(
     project_id: str = Path(..., description="Project ID"),
     api_key: str = Depends(verify_api_key),
     correlation_id: str = Depends(get_correlation_id),
-    settings: Settings = Depends(get_settings),
+    client: DepotClient = Depends(get_depot_client),
 ) -> List[str]:
     """
     List versions for a depot project.
@@ -139,7 +140,6 @@ async def list_project_versions(
     )
     
     try:
-        client = DepotClient(settings=settings)
         versions = await client.list_versions(project_id)
         
         return versions
@@ -155,7 +155,7 @@ async def get_project_entities(
     version: str = Path(..., description="Version"),
     api_key: str = Depends(verify_api_key),
     correlation_id: str = Depends(get_correlation_id),
-    settings: Settings = Depends(get_settings),
+    client: DepotClient = Depends(get_depot_client),
 ) -> List[DepotEntity]:
     """
     Get entities for a specific project version.
@@ -170,20 +170,15 @@ async def get_project_entities(
     )
     
     try:
-        client = DepotClient(settings=settings)
         entities = await client.get_entities(
             project_id=project_id,
             version=version,
         )
         
-        return [
-            DepotEntity(
-                **e,
-                project_id=project_id,
-                version=version,
-            )
+        return _entities_adapter.validate_python([
+            {**e, "project_id": project_id, "version": version}
             for e in entities
-        ]
+        ])
         
     except Exception as e:
         logger.error("Failed to get entities", error=str(e))
@@ -197,7 +192,7 @@ async def get_project_dependencies(
     transitive: bool = Query(False, description="Include transitive dependencies"),
     api_key: str = Depends(verify_api_key),
     correlation_id: str = Depends(get_correlation_id),
-    settings: Settings = Depends(get_settings),
+    client: DepotClient = Depends(get_depot_client),
 ) -> Dict[str, Any]:
     """
     Get dependencies for a project version.
@@ -213,7 +208,6 @@ async def get_project_dependencies(
     )
     
     try:
-        client = DepotClient(settings=settings)
         dependencies = await client.get_dependencies(
             project_id=project_id,
             version=version,
@@ -239,7 +233,7 @@ async def publish_to_depot(
     version: str = Body(..., embed=True),
     api_key: str = Depends(verify_api_key),
     correlation_id: str = Depends(get_correlation_id),
-    settings: Settings = Depends(get_settings),
+    client: DepotClient = Depends(get_depot_client),
 ) -> Dict[str, Any]:
     """
     Publish a project version to depot.
@@ -254,7 +248,6 @@ async def publish_to_depot(
     )
     
     try:
-        client = DepotClient(settings=settings)
         result = await client.publish(
             project_id=project_id,
             version=version,
@@ -8,9 +8,8 @@ import structlog
 from fastapi import APIRouter, Body, Depends, HTTPException
 from pydantic import BaseModel, Field
 
-from legend_guardian.api.deps import get_correlation_id, verify_api_key
+from legend_guardian.api.deps import get_correlation_id, get_engine_client, verify_api_key
 from legend_guardian.clients.engine import EngineClient
-from legend_guardian.config import Settings, get_settings
 
 router = APIRouter()
 logger = structlog.get_logger()
@@ -52,7 +51,7 @@ async def compile_pure(
     request: CompileRequest,
     api_key: str = Depends(verify_api_key),
     correlation_id: str = Depends(get_correlation_id),
-    settings: Settings = Depends(get_settings),
+    client: EngineClient = Depends(get_engine_client),
 ) -> CompileResponse:
     """
     Compile PURE code.
@@ -62,7 +61,6 @@ async def compile_pure(
     logger.info("Compiling PURE", correlation_id=correlation_id, size=len(request.pure))
     
     try:
-        client = EngineClient(settings=settings)
         result = await client.compile(
             pure=request.pure,
             project_id=request.project_id,
@@ -84,7 +82,7 @@ async def generate_execution_plan(
     request: ExecutionPlanRequest,
     api_key: str = Depends(verify_api_key),
     correlation_id: str = Depends(get_correlation_id),
-    settings: Settings = Depends(get_settings),
+    client: EngineClient = Depends(get_engine_client),
 ) -> Dict[str, Any]:
     """
     Generate execution plan for a query.
@@ -99,7 +97,6 @@ async def generate_execution_plan(
     )
     
     try:
-        client = EngineClient(settings=settings)
         plan = await client.generate_execution_plan(
             mapping=request.mapping,
             runtime=request.runtime,
@@ -122,7 +119,7 @@ async def transform_to_schema(
     request: TransformRequest,
     api_key: str = Depends(verify_api_key),
     correlation_id: str = Depends(get_correlation_id),
-    settings: Settings = Depends(get_settings),
+    client: EngineClient = Depends(get_engine_client),
 ) -> Dict[str, Any]:
     """
     Transform a class to a schema format.
@@ -137,7 +134,6 @@ async def transform_to_schema(
     )
     
     try:
-        client = EngineClient(settings=settings)
         schema = await client.transform_to_schema(
             schema_type=schema_type,
             class_path=request.class_path,
@@ -162,7 +158,7 @@ async def run_service(
     params: Dict[str, Any] = Body(default={}),
     api_key: str = Depends(verify_api_key),
     correlation_id: str = Depends(get_correlation_id),
-    settings: Settings = Depends(get_settings),
+    client: EngineClient = Depends(get_engine_client),
 ) -> Dict[str, Any]:
     """
     Run a Legend service.
@@ -177,7 +173,6 @@ async def run_service(
     )
     
     try:
-        client = EngineClient(settings=settings)
         result = await client.run_service(
             path=path,
             params=params,
@@ -199,7 +194,7 @@ async def run_tests(
     test_path: Optional[str] = None,
     api_key: str = Depends(verify_api_key),
     correlation_id: str = Depends(get_correlation_id),
-    settings: Settings = Depends(get_settings),
+    client: EngineClient = Depends(get_engine_client),
 ) -> Dict[str, Any]:
     """
     Run Legend tests.
@@ -209,7 +204,6 @@ async def run_tests(
     logger.info("Running tests", correlation_id=correlation_id, test_path=test_path)
     
     try:
-        client = EngineClient(settings=settings)
         results = await client.run_tests(test_path=test_path)
         
         return {
@@ -228,11 +222,10 @@ async def run_tests(
 async def get_engine_info(
     api_key: str = Depends(verify_api_key),
     correlation_id: str = Depends(get_correlation_id),
-    settings: Settings = Depends(get_settings),
+    client: EngineClient = Depends(get_engine_client),
 ) -> Dict[str, Any]:
     """Get Legend Engine information and version."""
     try:
-        client = EngineClient(settings=settings)
         info = await client.get_info()
         
         return {
@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
+import httpx
 import structlog
 from fastapi import APIRouter, Body, Depends, HTTPException, Path
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-
-from legend_guardian.api.deps import get_correlation_id, get_project_id, get_workspace_id, verify_api_key
+from starlette.background import BackgroundTask
+
+from legend_guardian.api.deps import (
+    get_correlation_id,
+    get_project_id,
+    get_sdlc_client,
+    get_workspace_id,
+    verify_api_key,
+)
 from legend_guardian.clients.sdlc import SDLCClient
 from legend_guardian.config import Settings, get_settings
 
@@ -48,11 +57,20 @@ class VersionRequest(BaseModel):
     review_id: Optional[str] = Field(None, description="Associated review ID")
 
 
+async def _stream_body(response: httpx.Response) -> AsyncIterator[bytes]:
+    """Yield an upstream response body, closing it even if the download is abandoned."""
+    try:
+        async for chunk in response.aiter_bytes():
+            yield chunk
+    finally:
+        await response.aclose()
+
+
 @router.get("/projects")
 async def list_projects(
     api_key: str = Depends(verify_api_key),
     correlation_id: str = Depends(get_correlation_id),
-    settings: Settings = Depends(get_settings),
+    client: SDLCClient = Depends(get_sdlc_client),
 ) -> List[Dict[str, Any]]:
     """
     List all SDLC projects.
@@ -62,7 +80,6 @@ async def list_projects(
     logger.info("Listing projects", correlation_id=correlation_id)
     
     try:
-        client = SDLCClient(settings=settings)
         projects = await client.list_projects()
         
         return projects
@@ -77,13 +94,12 @@ async def get_project(
     project_id: str = Path(..., description="Project ID"),
     api_key: str = Depends(verify_api_key),
     correlation_id: str = Depends(get_correlation_id),
-    settings: Settings = Depends(get_settings),
+    client: SDLCClient = Depends(get_sdlc_client),
 ) -> Dict[str, Any]:
     """Get project details."""
     logger.info("Getting project", correlation_id=correlation_id, project_id=project_id)
     
     try:
-        client = SDLCClient(settings=settings)
         project = await client.get_project(project_id)
         
         return project
@@ -99,7 +115,7 @@ async def create_workspace(
     project_id: str = Depends(get_project_id),
     api_key: str = Depends(verify_api_key),
     correlation_id: str = Depends(get_correlation_id),
-    settings: Settings = Depends(get_settings),
+    client: SDLCClient = Depends(get_sdlc_client),
 ) -> Dict[str, Any]:
     """
     Create a new workspace.
@@ -114,7 +130,6 @@ async def create_workspace(
     )
     
     try:
-        client = SDLCClient(settings=settings)
         workspace = await client.create_workspace(
             project_id=project_id,
             workspace_id=workspace_id,
@@ -132,13 +147,12 @@ async def list_workspaces(
     project_id: str = Depends(get_project_id),
     api_key: str = Depends(verify_api_key),
     correlation_id: str = Depends(get_correlation_id),
-    settings: Settings = Depends(get_settings),
+    client: SDLCClient = Depends(get_sdlc_client),
 ) -> List[Dict[str, Any]]:
     """List all workspaces for a project."""
     logger.info("Listing workspaces", correlation_id=correlation_id, project_id=project_id)
     
     try:
-        client = SDLCClient(settings=settings)
         workspaces = await client.list_workspaces(project_id)
         
         return workspaces
@@ -155,7 +169,7 @@ async def upsert_entities(
     workspace_id: str = Depends(get_workspace_id),
     api_key: str = Depends(verify_api_key),
     correlation_id: str = Depends(get_correlation_id),
-    settings: Settings = Depends(get_settings),
+    client: SDLCClient = Depends(get_sdlc_client),
 ) -> Dict[str, Any]:
     """
     Upsert entities to a workspace.
@@ -172,11 +186,11 @@ async def upsert_entities(
     )
     
     try:
-        client = SDLCClient(settings=settings)
         result = await client.upsert_entities(
             project_id=project_id,
             workspace_id=workspace_id,
-            entities=[e.dict() for e in request.entities],
+            # One serializer call for the whole list instead of one per entity
+            entities=request.model_dump(include={"entities"})["entities"],
             replace=request.replace,
         )
         
@@ -193,15 +207,20 @@ async def upsert_entities(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/entities")
+@router.get("/entities", response_model=List[Dict[str, Any]])
 async def get_entities(
     project_id: str = Depends(get_project_id),
     workspace_id: str = Depends(get_workspace_id),
     api_key: str = Depends(verify_api_key),
     correlation_id: str = Depends(get_correlation_id),
-    settings: Settings = Depends(get_settings),
-) -> List[Dict[str, Any]]:
-    """Get all entities in a workspace."""
+    client: SDLCClient = Depends(get_sdlc_client),
+) -> StreamingResponse:
+    """
+    Get all entities in a workspace.
+    
+    The SDLC response body is streamed through as-is rather than parsed
+    and re-serialized, so large workspaces are never held in memory.
+    """
     logger.info(
         "Getting entities",
         correlation_id=correlation_id,
@@ -210,17 +229,22 @@ async def get_entities(
     )
     
     try:
-        client = SDLCClient(settings=settings)
-        entities = await client.get_entities(
+        response = await client.stream_entities(
             project_id=project_id,
             workspace_id=workspace_id,
         )
-        
-        return entities
-        
     except Exception as e:
         logger.error("Failed to get entities", error=str(e))
         raise HTTPException(status_code=500, detail=str(e))
+    
+    # The generator closes the upstream response once iteration starts; the
+    # background task covers a client that disconnects before the first chunk.
+    # aclose() is idempotent, so closing twice is safe.
+    return StreamingResponse(
+        _stream_body(response),
+        media_type=response.headers.get("content-type", "application/json"),
+        background=BackgroundTask(response.aclose),
+    )
 
 
 @router.post("/reviews")
@@ -230,6 +254,7 @@ async def create_review(
     api_key: str = Depends(verify_api_key),
     correlation_id: str = Depends(get_correlation_id),
     settings: Settings = Depends(get_settings),
+    client: SDLCClient = Depends(get_sdlc_client),
 ) -> Dict[str, Any]:
     """
     Create a review/PR.
@@ -247,7 +272,6 @@ async def create_review(
     )
     
     try:
-        client = SDLCClient(settings=settings)
         review = await client.create_review(
             project_id=project_id,
             workspace_id=workspace_id,
@@ -269,7 +293,7 @@ async def list_reviews(
     state: str = "open",
     api_key: str = Depends(verify_api_key),
     correlation_id: str = Depends(get_correlation_id),
-    settings: Settings = Depends(get_settings),
+    client: SDLCClient = Depends(get_sdlc_client),
 ) -> List[Dict[str, Any]]:
     """List reviews for a project."""
     logger.info(
@@ -280,7 +304,6 @@ async def list_reviews(
     )
     
     try:
-        client = SDLCClient(settings=settings)
         reviews = await client.list_reviews(
             project_id=project_id,
             state=state,
@@ -299,7 +322,7 @@ async def create_version(
     project_id: str = Depends(get_project_id),
     api_key: str = Depends(verify_api_key),
     correlation_id: str = Depends(get_correlation_id),
-    settings: Settings = Depends(get_settings),
+    client: SDLCClient = Depends(get_sdlc_client),
 ) -> Dict[str, Any]:
     """
     Create a new version.
@@ -314,7 +337,6 @@ async def create_version(
     )
     
     try:
-        client = SDLCClient(settings=settings)
         version = await client.create_version(
             project_id=project_id,
             version_id=request.version_id,
@@ -334,13 +356,12 @@ async def list_versions(
     project_id: str = Depends(get_project_id),
     api_key: str = Depends(verify_api_key),
     correlation_id: str = Depends(get_correlation_id),
-    settings: Settings = Depends(get_settings),
+    client: SDLCClient = Depends(get_sdlc_client),
 ) -> List[Dict[str, Any]]:
     """List all versions of a project."""
     logger.info("Listing versions", correlation_id=correlation_id, project_id=project_id)
     
     try:
-        client = SDLCClient(settings=settings)
         versions = await client.list_versions(project_id)
         
         return versions
@@ -1,11 +1,12 @@
 """Health check endpoints."""
 
 import asyncio
-from typing import Any, Dict
+import time
+from typing import Any, Dict, Optional, Tuple
 
 import httpx
 import structlog
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, FastAPI, Request
 
 from legend_guardian.api.deps import get_correlation_id
 from legend_guardian.config import Settings, get_settings
@@ -14,16 +15,75 @@ router = APIRouter()
 logger = structlog.get_logger()
 
 
-async def check_service_health(url: str, path: str = "/", timeout: float = 5.0) -> Dict[str, Any]:
-    """Check health of a service."""
+def get_health_client(app: FastAPI) -> httpx.AsyncClient:
+    """
+    Get the app's pooled health check client, creating it on first use.
+    
+    One client per app lets polls reuse keep-alive connections, and keeps
+    each client on the event loop of the app that created it.
+    """
+    client = getattr(app.state, "health_client", None)
+    if client is None:
+        client = app.state.health_client = httpx.AsyncClient(timeout=5.0)
+    return client
+
+
+async def close_health_client(app: FastAPI) -> None:
+    """Close and forget the app's health check client."""
+    client = getattr(app.state, "health_client", None)
+    app.state.health_client = None
+    if client is not None:
+        await client.aclose()
+
+
+class ReadinessCache:
+    """Last readiness result for one app, and the lock that coalesces probes."""
+    
+    def __init__(self):
+        """Initialize an empty cache."""
+        self.lock = asyncio.Lock()
+        # (checked_at, (engine_url, sdlc_url), payload)
+        self.entry: Optional[Tuple[float, Tuple[str, str], Dict[str, Any]]] = None
+    
+    def fresh(self, key: Tuple[str, str], max_age: float) -> Optional[Dict[str, Any]]:
+        """Get the cached result if it is recent and for the same services."""
+        entry = self.entry
+        if entry is not None and entry[1] == key and time.monotonic() - entry[0] < max_age:
+            return entry[2]
+        return None
+
+
+def get_readiness_cache(app: FastAPI) -> ReadinessCache:
+    """Get the app's readiness cache, creating it on first use."""
+    cache = getattr(app.state, "readiness_cache", None)
+    if cache is None:
+        cache = app.state.readiness_cache = ReadinessCache()
+    return cache
+
+
+def reset_readiness_cache(app: FastAPI) -> None:
+    """Forget the app's readiness cache, e.g. on shutdown."""
+    app.state.readiness_cache = None
+
+
+async def check_service_health(
+    url: str,
+    path: str = "/",
+    timeout: float = 5.0,
+    client: Optional[httpx.AsyncClient] = None,
+) -> Dict[str, Any]:
+    """Check health of a service, on the given pooled client or a one-off one."""
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(f"{url}{path}")
-            return {
-                "status": "up" if response.status_code < 500 else "degraded",
-                "latency_ms": round(response.elapsed.total_seconds() * 1000, 2),
-                "status_code": response.status_code,
-            }
+        if client is not None:
+            response = await client.get(f"{url}{path}", timeout=timeout)
+        else:
+            async with httpx.AsyncClient(timeout=timeout) as one_off_client:
+                response = await one_off_client.get(f"{url}{path}")
+        return {
+            "status": "up" if response.status_code < 500 else "degraded",
+            "latency_ms": round(response.elapsed.total_seconds() * 1000, 2),
+            "status_code": response.status_code,
+        }
     except Exception as e:
         logger.warning(f"Health check failed for {url}", error=str(e))
         return {
@@ -34,6 +94,7 @@ async def check_service_health(url: str, path: str = "/", timeout: float = 5.0)
 
 @router.get("/health")
 async def health_check(
+    request: Request,
     correlation_id: str = Depends(get_correlation_id),
     settings: Settings = Depends(get_settings),
 ) -> Dict[str, Any]:
@@ -42,14 +103,15 @@ async def health_check(
     
     Returns the health status of the agent and all dependent services.
     """
-    logger.info("Health check requested", correlation_id=correlation_id)
+    logger.debug("Health check requested", correlation_id=correlation_id)
     
     # Check dependent services
+    client = get_health_client(request.app)
     checks = await asyncio.gather(
-        check_service_health(settings.engine_url, "/api/server/v1/info"),
-        check_service_health(settings.sdlc_url, "/api/info"),
-        check_service_health(settings.depot_url, "/api/info"),
-        check_service_health(settings.studio_url, "/studio"),
+        check_service_health(settings.engine_url, "/api/server/v1/info", client=client),
+        check_service_health(settings.sdlc_url, "/api/info", client=client),
+        check_service_health(settings.depot_url, "/api/info", client=client),
+        check_service_health(settings.studio_url, "/studio", client=client),
         return_exceptions=True,
     )
     
@@ -82,22 +144,44 @@ async def liveness_probe() -> Dict[str, str]:
 
 @router.get("/health/ready")
 async def readiness_probe(
+    request: Request,
     settings: Settings = Depends(get_settings),
 ) -> Dict[str, Any]:
     """
     Kubernetes readiness probe.
     
-    Checks if the service is ready to accept traffic.
+    Checks if the service is ready to accept traffic. Results are reused for
+    readiness_cache_seconds, and concurrent probes share one upstream check.
     """
-    # Quick check of critical services
+    cache = get_readiness_cache(request.app)
+    key = (settings.engine_url, settings.sdlc_url)
+    
+    cached = cache.fresh(key, settings.readiness_cache_seconds)
+    if cached is not None:
+        return cached
+    
+    async with cache.lock:
+        # Another probe may have refreshed the result while we waited
+        cached = cache.fresh(key, settings.readiness_cache_seconds)
+        if cached is not None:
+            return cached
+        
+        result = await _check_readiness(get_health_client(request.app), settings)
+        cache.entry = (time.monotonic(), key, result)
+        return result
+
+
+async def _check_readiness(client: httpx.AsyncClient, settings: Settings) -> Dict[str, Any]:
+    """Check the critical services concurrently."""
     try:
-        async with httpx.AsyncClient(timeout=2.0) as client:
-            engine_check = await client.get(f"{settings.engine_url}/api/server/v1/info")
-            sdlc_check = await client.get(f"{settings.sdlc_url}/api/info")
-            
-            if engine_check.status_code < 500 and sdlc_check.status_code < 500:
-                return {"status": "ready"}
+        engine_check, sdlc_check = await asyncio.gather(
+            client.get(f"{settings.engine_url}/api/server/v1/info", timeout=2.0),
+            client.get(f"{settings.sdlc_url}/api/info", timeout=2.0),
+        )
+        
+        if engine_check.status_code < 500 and sdlc_check.status_code < 500:
+            return {"status": "ready"}
     except Exception as e:
         logger.error("Readiness check failed", error=str(e))
     
-    return {"status": "not_ready"}
\ No newline at end of file
+    return {"status": "not_ready"}
@@ -1,5 +1,6 @@
 """Intent processing endpoints."""
 
+import asyncio
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -51,6 +52,25 @@ class IntentResponse(BaseModel):
     execution_time_ms: float
 
 
+async def _run_step(orchestrator: AgentOrchestrator, step: Step) -> None:
+    """Execute a step, recording its status, result and timing on it."""
+    step.started_at = datetime.utcnow()
+    step.status = "running"
+    
+    try:
+        step.result = await orchestrator.execute_step(
+            action=step.action,
+            params=step.params,
+        )
+        step.status = "completed"
+    except Exception as e:
+        step.status = "failed"
+        step.error = str(e)
+        logger.error(f"Step {step.id} failed", error=str(e))
+    
+    step.completed_at = datetime.utcnow()
+
+
 @router.post("/", response_model=IntentResponse)
 async def process_intent(
     request: IntentRequest,
@@ -73,7 +93,7 @@ async def process_intent(
     """
     import time
     
-    start_time = time.time()
+    start_time = time.monotonic()
     
     logger.info(
         "Processing intent",
@@ -112,24 +132,16 @@ async def process_intent(
         artifacts = []
         logs = []
         
-        # Execute if requested
+        # Execute if requested, running independent read-only steps together
         if request.execute:
-            for step in steps:
-                step.started_at = datetime.utcnow()
-                step.status = "running"
+            for wave in orchestrator.plan_waves(plan):
+                wave_steps = [steps[i] for i in wave]
+                await asyncio.gather(*(_run_step(orchestrator, step) for step in wave_steps))
                 
-                try:
-                    result = await orchestrator.execute_step(
-                        action=step.action,
-                        params=step.params,
-                    )
-                    
-                    step.status = "completed"
-                    step.result = result
-                    step.completed_at = datetime.utcnow()
-                    
-                    # Collect outputs
-                    if result:
+                # Collect outputs in plan order
+                for step in wave_steps:
+                    result = step.result
+                    if step.status == "completed" and result:
                         actions.append({
                             "step_id": step.id,
                             "action": step.action,
@@ -141,15 +153,9 @@ async def process_intent(
                                 artifacts.append(result["artifact"])
                             if "log" in result:
                                 logs.append(result["log"])
-                    
-                except Exception as e:
-                    step.status = "failed"
-                    step.error = str(e)
-                    step.completed_at = datetime.utcnow()
-                    logger.error(f"Step {step.id} failed", error=str(e))
-                    
-                    if not settings.debug:
-                        break  # Stop on first error in production
+                
+                if not settings.debug and any(step.status == "failed" for step in wave_steps):
+                    break  # Stop on first error in production
         
         # Determine overall status
         if not request.execute:
@@ -161,7 +167,7 @@ async def process_intent(
         else:
             status = "partial"
         
-        execution_time = (time.time() - start_time) * 1000
+        execution_time = (time.monotonic() - start_time) * 1000
         
         logger.info(
             "Intent processed",
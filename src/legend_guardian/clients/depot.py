@@ -26,6 +26,22 @@ class DepotClient:
         
         if settings.depot_token:
             self.headers["Authorization"] = f"Bearer {settings.depot_token}"
+        
+        # Pooled HTTP client, created on first request and reused so
+        # connections and TLS sessions are kept alive between calls
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     @retry(
         stop=stop_after_attempt(3),
@@ -41,35 +57,36 @@ class DepotClient:
         """Make HTTP request to Depot."""
         url = f"{self.base_url}{path}"
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.request(
-                method=method,
-                url=url,
-                headers=self.headers,
-                json=json_data,
-                params=params,
-            )
-            
-            logger.debug(
-                "Depot request",
-                method=method,
-                path=path,
+        client = self._get_client()
+        
+        response = await client.request(
+            method=method,
+            url=url,
+            headers=self.headers,
+            json=json_data,
+            params=params,
+        )
+        
+        logger.debug(
+            "Depot request",
+            method=method,
+            path=path,
+            status=response.status_code,
+        )
+        
+        if response.status_code >= 400:
+            error_detail = response.text
+            logger.error(
+                "Depot request failed",
                 status=response.status_code,
+                error=error_detail,
             )
-            
-            if response.status_code >= 400:
-                error_detail = response.text
-                logger.error(
-                    "Depot request failed",
-                    status=response.status_code,
-                    error=error_detail,
-                )
-                raise Exception(f"Depot API error: {response.status_code} - {error_detail}")
-            
-            if response.headers.get("content-type", "").startswith("application/json"):
-                return response.json()
-            else:
-                return response.text
+            raise Exception(f"Depot API error: {response.status_code} - {error_detail}")
+        
+        if response.headers.get("content-type", "").startswith("application/json"):
+            return response.json()
+        else:
+            return response.text
     
     async def get_info(self) -> Dict[str, Any]:
         """Get Depot server information."""
@@ -27,6 +27,22 @@ class EngineClient:
         
         if settings.engine_token:
             self.headers["Authorization"] = f"Bearer {settings.engine_token}"
+        
+        # Pooled HTTP client, created on first request and reused so
+        # connections and TLS sessions are kept alive between calls
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     @retry(
         stop=stop_after_attempt(3),
@@ -43,41 +59,42 @@ class EngineClient:
         """Make HTTP request to Engine."""
         url = f"{self.base_url}{path}"
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            headers = self.headers.copy()
-            
-            if data and not json_data:
-                headers["Content-Type"] = "text/plain"
-            
-            response = await client.request(
-                method=method,
-                url=url,
-                headers=headers,
-                json=json_data,
-                content=data,
-                params=params,
-            )
-            
-            logger.debug(
-                "Engine request",
-                method=method,
-                path=path,
+        client = self._get_client()
+        
+        headers = self.headers.copy()
+        
+        if data and not json_data:
+            headers["Content-Type"] = "text/plain"
+        
+        response = await client.request(
+            method=method,
+            url=url,
+            headers=headers,
+            json=json_data,
+            content=data,
+            params=params,
+        )
+        
+        logger.debug(
+            "Engine request",
+            method=method,
+            path=path,
+            status=response.status_code,
+        )
+        
+        if response.status_code >= 400:
+            error_detail = response.text
+            logger.error(
+                "Engine request failed",
                 status=response.status_code,
+                error=error_detail,
             )
-            
-            if response.status_code >= 400:
-                error_detail = response.text
-                logger.error(
-                    "Engine request failed",
-                    status=response.status_code,
-                    error=error_detail,
-                )
-                raise Exception(f"Engine API error: {response.status_code} - {error_detail}")
-            
-            if response.headers.get("content-type", "").startswith("application/json"):
-                return response.json()
-            else:
-                return {"text": response.text}
+            raise Exception(f"Engine API error: {response.status_code} - {error_detail}")
+        
+        if response.headers.get("content-type", "").startswith("application/json"):
+            return response.json()
+        else:
+            return {"text": response.text}
     
     async def get_info(self) -> Dict[str, Any]:
         """Get Engine server information."""
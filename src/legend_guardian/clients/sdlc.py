@@ -26,6 +26,22 @@ class SDLCClient:
         
         if settings.sdlc_token:
             self.headers["Authorization"] = f"Bearer {settings.sdlc_token}"
+        
+        # Pooled HTTP client, created on first request and reused so
+        # connections and TLS sessions are kept alive between calls
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     @retry(
         stop=stop_after_attempt(3),
@@ -41,35 +57,36 @@ class SDLCClient:
         """Make HTTP request to SDLC."""
         url = f"{self.base_url}{path}"
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.request(
-                method=method,
-                url=url,
-                headers=self.headers,
-                json=json_data,
-                params=params,
-            )
-            
-            logger.debug(
-                "SDLC request",
-                method=method,
-                path=path,
+        client = self._get_client()
+        
+        response = await client.request(
+            method=method,
+            url=url,
+            headers=self.headers,
+            json=json_data,
+            params=params,
+        )
+        
+        logger.debug(
+            "SDLC request",
+            method=method,
+            path=path,
+            status=response.status_code,
+        )
+        
+        if response.status_code >= 400:
+            error_detail = response.text
+            logger.error(
+                "SDLC request failed",
                 status=response.status_code,
+                error=error_detail,
             )
-            
-            if response.status_code >= 400:
-                error_detail = response.text
-                logger.error(
-                    "SDLC request failed",
-                    status=response.status_code,
-                    error=error_detail,
-                )
-                raise Exception(f"SDLC API error: {response.status_code} - {error_detail}")
-            
-            if response.headers.get("content-type", "").startswith("application/json"):
-                return response.json()
-            else:
-                return response.text
+            raise Exception(f"SDLC API error: {response.status_code} - {error_detail}")
+        
+        if response.headers.get("content-type", "").startswith("application/json"):
+            return response.json()
+        else:
+            return response.text
     
     async def get_info(self) -> Dict[str, Any]:
         """Get SDLC server information."""
@@ -231,6 +248,55 @@ class SDLCClient:
             f"/api/projects/{project_id}/workspaces/{workspace_id}/entities",
         )
     
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=10),
+    )
+    async def stream_entities(
+        self,
+        project_id: str,
+        workspace_id: str,
+    ) -> httpx.Response:
+        """
+        Open the entities of a workspace as a streamed response.
+        
+        The body is not read, so callers can pass it on chunk by chunk
+        instead of building the entity list in memory. Callers must close
+        the response.
+        
+        Args:
+            project_id: Project identifier
+            workspace_id: Workspace identifier
+        
+        Returns:
+            Open response with an unread JSON body
+        """
+        logger.info(
+            "Streaming entities",
+            project_id=project_id,
+            workspace_id=workspace_id,
+        )
+        
+        client = self._get_client()
+        request = client.build_request(
+            "GET",
+            f"{self.base_url}/api/projects/{project_id}/workspaces/{workspace_id}/entities",
+            headers=self.headers,
+        )
+        response = await client.send(request, stream=True)
+        
+        if response.status_code >= 400:
+            await response.aread()
+            await response.aclose()
+            logger.error(
+                "SDLC request failed",
+                status=response.status_code,
+                error=response.text,
+            )
+            raise Exception(f"SDLC API error: {response.status_code} - {response.text}")
+        
+        return response
+    
     async def upsert_entities(
         self,
         project_id: str,
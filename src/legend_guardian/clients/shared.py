@@ -0,0 +1,77 @@
+"""Process-wide Legend service clients."""
+
+from typing import Dict, Tuple
+
+import structlog
+
+from legend_guardian.clients.depot import DepotClient
+from legend_guardian.clients.engine import EngineClient
+from legend_guardian.clients.sdlc import SDLCClient
+from legend_guardian.config import Settings
+
+logger = structlog.get_logger()
+
+
+class LegendClients:
+    """Engine, SDLC and Depot clients built from one set of settings."""
+    
+    def __init__(self, settings: Settings):
+        """Initialize the client bundle."""
+        self.engine = EngineClient(settings)
+        self.sdlc = SDLCClient(settings)
+        self.depot = DepotClient(settings)
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP clients."""
+        await self.engine.aclose()
+        await self.sdlc.aclose()
+        await self.depot.aclose()
+
+
+# Bundles keyed by the settings that affect how the clients connect
+_shared_clients: Dict[Tuple, LegendClients] = {}
+
+
+def _connection_key(settings: Settings) -> Tuple:
+    """Build the cache key for a settings instance."""
+    return (
+        settings.engine_url,
+        settings.engine_token,
+        settings.sdlc_url,
+        settings.sdlc_token,
+        settings.depot_url,
+        settings.depot_token,
+        settings.request_timeout,
+    )
+
+
+def get_legend_clients(settings: Settings) -> LegendClients:
+    """
+    Get the process-wide client bundle for the given settings.
+    
+    Settings objects are also built outside get_settings(), so bundles are
+    shared by connection details rather than by settings identity.
+    
+    Args:
+        settings: Application settings
+    
+    Returns:
+        Shared Legend clients
+    """
+    key = _connection_key(settings)
+    clients = _shared_clients.get(key)
+    if clients is None:
+        clients = _shared_clients[key] = LegendClients(settings)
+    return clients
+
+
+async def close_legend_clients() -> None:
+    """Close and forget every shared client bundle."""
+    bundles = list(_shared_clients.values())
+    _shared_clients.clear()
+    
+    for clients in bundles:
+        try:
+            await clients.aclose()
+        except Exception as e:
+            logger.warning(f"Failed to close Legend clients: {e}")
@@ -1,5 +1,6 @@
 """Application settings module."""
 
+from functools import lru_cache
 from typing import List, Optional
 
 from pydantic import Field, field_validator
@@ -63,6 +64,10 @@ class Settings(BaseSettings):
     agent_model: str = Field(default="gpt-4", description="LLM model for agent")
     agent_temperature: float = Field(default=0.7, description="LLM temperature")
     agent_max_tokens: int = Field(default=2000, description="Max tokens for LLM responses")
+    agent_memory_max_episodes: int = Field(
+        default=1000,
+        description="Episodes kept in agent memory (actions are capped at 10x)"
+    )
     
     # RAG Configuration
     rag_enabled: bool = Field(default=True, description="Enable RAG for context")
@@ -78,6 +83,10 @@ class Settings(BaseSettings):
     request_timeout: int = Field(default=30, description="Default request timeout in seconds")
     max_retries: int = Field(default=3, description="Max retries for failed requests")
     circuit_breaker_threshold: int = Field(default=5, description="Circuit breaker failure threshold")
+    readiness_cache_seconds: float = Field(
+        default=2.0,
+        description="How long a readiness probe result is reused before re-checking",
+    )
     
     @field_validator("valid_api_keys", mode="before")
     @classmethod
@@ -103,6 +112,7 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
+@lru_cache
 def get_settings() -> Settings:
     """Get cached settings instance."""
     return Settings()
@@ -1,5 +1,6 @@
 """Document loader for RAG system."""
 
+import asyncio
 import json
 import yaml
 from pathlib import Path
@@ -23,7 +24,7 @@ class Loader:
         Returns:
             List of loaded documents with metadata
         """
-        documents = []
+        file_paths = []
         
         for path_str in paths:
             path = Path(path_str)
@@ -32,17 +33,16 @@ class Loader:
                 continue
                 
             if path.is_file():
-                doc = await self._load_file(path)
-                if doc:
-                    documents.append(doc)
+                file_paths.append(path)
             elif path.is_dir():
                 for file_path in path.rglob('*'):
                     if file_path.suffix in self.supported_extensions:
-                        doc = await self._load_file(file_path)
-                        if doc:
-                            documents.append(doc)
+                        file_paths.append(file_path)
         
-        return documents
+        # Load all files concurrently; gather keeps the discovery order
+        loaded = await asyncio.gather(*(self._load_file(path) for path in file_paths))
+        
+        return [doc for doc in loaded if doc]
     
     async def _load_file(self, path: Path) -> Dict[str, Any]:
         """
@@ -55,15 +55,8 @@ class Loader:
             Document dict with content and metadata
         """
         try:
-            if path.suffix in {'.json'}:
-                with open(path, 'r') as f:
-                    content = json.load(f)
-            elif path.suffix in {'.yaml', '.yml'}:
-                with open(path, 'r') as f:
-                    content = yaml.safe_load(f)
-            else:
-                with open(path, 'r') as f:
-                    content = f.read()
+            # File reads and parsing block, so run them off the event loop
+            content = await asyncio.to_thread(self._read_file, path)
             
             return {
                 'path': str(path),
@@ -73,4 +66,24 @@ class Loader:
             }
         except Exception as e:
             print(f"Error loading {path}: {e}")
-            return None
\ No newline at end of file
+            return None
+    
+    def _read_file(self, path: Path) -> Any:
+        """
+        Read and parse a file according to its extension.
+        
+        Args:
+            path: File path
+            
+        Returns:
+            Parsed JSON/YAML data, or the raw text for other files
+        """
+        if path.suffix in {'.json'}:
+            with open(path, 'r') as f:
+                return json.load(f)
+        elif path.suffix in {'.yaml', '.yml'}:
+            with open(path, 'r') as f:
+                return yaml.safe_load(f)
+        else:
+            with open(path, 'r') as f:
+                return f.read()
\ No newline at end of file
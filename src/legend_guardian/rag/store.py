@@ -1,6 +1,8 @@
 """Vector store for RAG system."""
 
 from typing import Dict, List, Any, Optional
+import hashlib
+import heapq
 import json
 from pathlib import Path
 
@@ -16,6 +18,10 @@ class VectorStore:
             persist_path: Optional path to persist the store
         """
         self.documents = {}
+        # Lowercased document text used for keyword scoring, keyed by doc id
+        self._search_text: Dict[str, str] = {}
+        # Content hash of each document as last added, keyed by doc id
+        self._doc_hashes: Dict[str, str] = {}
         self.persist_path = Path(persist_path) if persist_path else None
         
         if self.persist_path and self.persist_path.exists():
@@ -28,13 +34,36 @@ class VectorStore:
         Args:
             documents: List of documents to add
         """
+        changed = False
+        
         for doc in documents:
             doc_id = doc.get('path', str(len(self.documents)))
-            self.documents[doc_id] = doc
+            # Re-adding an unchanged document is a no-op. Compare hashes, not
+            # the stored dict, which may be the caller's object edited in place.
+            doc_hash = self._hash_document(doc)
+            if doc_id not in self.documents or self._doc_hashes.get(doc_id) != doc_hash:
+                self.documents[doc_id] = doc
+                self._doc_hashes[doc_id] = doc_hash
+                self._search_text.pop(doc_id, None)
+                changed = True
         
-        if self.persist_path:
+        if changed and self.persist_path:
             self.save()
     
+    @staticmethod
+    def _hash_document(doc: Dict[str, Any]) -> str:
+        """
+        Hash a document's canonical JSON form.
+        
+        Args:
+            doc: Document
+            
+        Returns:
+            Hex digest of the document content
+        """
+        canonical = json.dumps(doc, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+    
     async def query(
         self,
         query: str,
@@ -52,34 +81,66 @@ class VectorStore:
         Returns:
             List of relevant documents
         """
-        # Simple keyword-based search for now
-        results = []
-        query_lower = query.lower()
+        results = await self.query_batch([query], top_k=top_k, filters=filters)
+        return results[0]
+    
+    async def query_batch(
+        self,
+        queries: List[str],
+        top_k: int = 5,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run several queries in one pass over the store.
         
-        for doc_id, doc in self.documents.items():
-            content = str(doc.get('content', '')).lower()
+        Args:
+            queries: Query strings
+            top_k: Number of top results to return per query
+            filters: Optional filters to apply
             
-            # Apply filters if provided
-            if filters:
-                match = True
-                for key, value in filters.items():
-                    if doc.get(key) != value:
-                        match = False
-                        break
-                if not match:
-                    continue
+        Returns:
+            List of relevant documents for each query, in query order
+        """
+        # Apply filters once for every query
+        candidates = []
+        for doc_id, doc in self.documents.items():
+            if filters and any(doc.get(key) != value for key, value in filters.items()):
+                continue
+            candidates.append((self._get_search_text(doc_id, doc), doc))
+        
+        batch_results = []
+        for query in queries:
+            query_lower = query.lower()
             
             # Simple relevance scoring based on keyword occurrence
-            score = content.count(query_lower)
-            if score > 0:
-                results.append({
-                    'document': doc,
-                    'score': score
-                })
+            scored = []
+            for content, doc in candidates:
+                score = content.count(query_lower)
+                if score > 0:
+                    scored.append((score, doc))
+            
+            # Keep the top_k highest scores, ties in insertion order
+            top = heapq.nlargest(top_k, scored, key=lambda x: x[0])
+            batch_results.append([doc for _, doc in top])
         
-        # Sort by score and return top_k
-        results.sort(key=lambda x: x['score'], reverse=True)
-        return [r['document'] for r in results[:top_k]]
+        return batch_results
+    
+    def _get_search_text(self, doc_id: str, doc: Dict[str, Any]) -> str:
+        """
+        Get the lowercased text of a document, computing it on first use.
+        
+        Args:
+            doc_id: Document ID
+            doc: Document
+            
+        Returns:
+            Lowercased document content
+        """
+        text = self._search_text.get(doc_id)
+        if text is None:
+            text = str(doc.get('content', '')).lower()
+            self._search_text[doc_id] = text
+        return text
     
     async def delete_documents(self, doc_ids: List[str]) -> None:
         """
@@ -88,10 +149,12 @@ class VectorStore:
         Args:
             doc_ids: List of document IDs to delete
         """
+        removed = [self.documents.pop(doc_id, None) for doc_id in doc_ids]
         for doc_id in doc_ids:
-            self.documents.pop(doc_id, None)
+            self._search_text.pop(doc_id, None)
+            self._doc_hashes.pop(doc_id, None)
         
-        if self.persist_path:
+        if self.persist_path and any(doc is not None for doc in removed):
             self.save()
     
     def save(self) -> None:
@@ -106,9 +169,15 @@ class VectorStore:
         if self.persist_path and self.persist_path.exists():
             with open(self.persist_path, 'r') as f:
                 self.documents = json.load(f)
+            self._search_text.clear()
+            self._doc_hashes = {
+                doc_id: self._hash_document(doc) for doc_id, doc in self.documents.items()
+            }
     
     def clear(self) -> None:
         """Clear all documents from the store."""
         self.documents.clear()
+        self._search_text.clear()
+        self._doc_hashes.clear()
         if self.persist_path and self.persist_path.exists():
             self.persist_path.unlink()
\ No newline at end of file
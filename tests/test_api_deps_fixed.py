@@ -12,7 +12,8 @@ from legend_guardian.api.deps import (
     get_project_id,
     get_workspace_id,
     get_pii_redactor,
-    PIIRedactor
+    PIIRedactor,
+    RateLimiter
 )
 from legend_guardian.config import Settings
 
@@ -144,4 +145,48 @@ async def test_correlation_id_format():
     # Should be either a UUID or a non-empty string
     assert result
     assert isinstance(result, str)
-    assert is_uuid
\ No newline at end of file
+    assert is_uuid
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_rejects_when_bucket_empty():
+    """Test rate limiter allows a burst up to the limit, then rejects."""
+    limiter = RateLimiter(max_requests=2, window_seconds=60)
+    mock_request = MagicMock()
+    
+    with patch("legend_guardian.api.deps.time.monotonic", return_value=100.0):
+        assert await limiter(mock_request, api_key="key-a") == "key-a"
+        assert await limiter(mock_request, api_key="key-a") == "key-a"
+        with pytest.raises(HTTPException) as exc_info:
+            await limiter(mock_request, api_key="key-a")
+        assert exc_info.value.status_code == 429
+        
+        # Buckets are per API key
+        assert await limiter(mock_request, api_key="key-b") == "key-b"
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_refills_over_time():
+    """Test rate limiter refills tokens at max_requests per window."""
+    limiter = RateLimiter(max_requests=2, window_seconds=60)
+    mock_request = MagicMock()
+    
+    with patch("legend_guardian.api.deps.time.monotonic", return_value=100.0):
+        await limiter(mock_request, api_key="key-a")
+        await limiter(mock_request, api_key="key-a")
+    
+    # One token comes back every 30 seconds
+    with patch("legend_guardian.api.deps.time.monotonic", return_value=130.0):
+        assert await limiter(mock_request, api_key="key-a") == "key-a"
+        with pytest.raises(HTTPException):
+            await limiter(mock_request, api_key="key-a")
+
+
+def test_pii_redactor_redacts_all_patterns():
+    """Test every PII pattern is redacted in a single pass."""
+    text = "Mail john@example.com, call 555-123-4567, SSN 123-45-6789, card 4532 1234 5678 9012"
+    
+    redacted = PIIRedactor.redact(text)
+    
+    assert redacted == "Mail [REDACTED], call [REDACTED], SSN [REDACTED], card [REDACTED]"
+    assert PIIRedactor.redact("") == ""
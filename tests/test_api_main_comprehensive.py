@@ -75,6 +75,117 @@ class TestLifespanManager:
             
             # Should log warning about OTEL not being available
             mock_logger.warning.assert_called()
+    
+    @pytest.mark.asyncio
+    async def test_lifespan_queues_log_records(self):
+        """Test root log handlers sit behind a queue while the app runs."""
+        import logging
+        from logging.handlers import QueueHandler
+        from legend_guardian.api.main import lifespan
+        
+        root = logging.getLogger()
+        records = []
+        
+        class ListHandler(logging.Handler):
+            def emit(self, record):
+                records.append(record)
+        
+        handler = ListHandler(level=logging.WARNING)
+        root.addHandler(handler)
+        try:
+            async with lifespan(FastAPI()):
+                assert handler not in root.handlers
+                assert any(isinstance(h, QueueHandler) for h in root.handlers)
+                logging.getLogger("queued").warning("queued record")
+            
+            # Shutdown flushes the queue and restores the handler
+            assert handler in root.handlers
+            assert not any(isinstance(h, QueueHandler) for h in root.handlers)
+            assert any(r.getMessage() == "queued record" for r in records)
+        finally:
+            root.removeHandler(handler)
+    
+    @pytest.mark.asyncio
+    async def test_lifespan_queues_uvicorn_log_records(self, capsys):
+        """Test the listener covers uvicorn's handlers under its default logging config."""
+        import logging
+        import logging.config
+        from logging.handlers import QueueHandler
+        from uvicorn.config import LOGGING_CONFIG
+        from legend_guardian.api.main import lifespan
+        
+        names = ("uvicorn", "uvicorn.error", "uvicorn.access")
+        saved = {}
+        for name in names:
+            target = logging.getLogger(name)
+            saved[name] = (list(target.handlers), target.level, target.propagate)
+        root = logging.getLogger()
+        
+        try:
+            logging.config.dictConfig(LOGGING_CONFIG)
+            uvicorn_logger = logging.getLogger("uvicorn")
+            access_logger = logging.getLogger("uvicorn.access")
+            original = list(uvicorn_logger.handlers) + list(access_logger.handlers)
+            
+            # Uvicorn leaves the root logger without handlers
+            with patch.object(root, "handlers", []):
+                async with lifespan(FastAPI()):
+                    assert all(isinstance(h, QueueHandler) for h in uvicorn_logger.handlers)
+                    assert all(isinstance(h, QueueHandler) for h in access_logger.handlers)
+                    # Logged the way uvicorn's protocols log a request
+                    access_logger.info(
+                        '%s - "%s %s HTTP/%s" %d',
+                        "127.0.0.1:5000", "GET", "/health", "1.1", 200,
+                    )
+            
+            assert list(uvicorn_logger.handlers) + list(access_logger.handlers) == original
+            captured = capsys.readouterr()
+            assert '127.0.0.1:5000 - "GET /health HTTP/1.1" 200' in captured.out
+            assert "Logging error" not in captured.err
+        finally:
+            for name, (handlers, level, propagate) in saved.items():
+                target = logging.getLogger(name)
+                target.handlers = handlers
+                target.setLevel(level)
+                target.propagate = propagate
+    
+    @pytest.mark.asyncio
+    async def test_lifespan_restores_log_handlers_when_close_fails(self):
+        """Test shutdown restores log handlers even if closing clients raises."""
+        import logging
+        from legend_guardian.api.main import lifespan
+        
+        root = logging.getLogger()
+        handler = logging.NullHandler()
+        root.addHandler(handler)
+        try:
+            with patch('legend_guardian.api.main.close_legend_clients', side_effect=RuntimeError("boom")):
+                with pytest.raises(RuntimeError):
+                    async with lifespan(FastAPI()):
+                        assert handler not in root.handlers
+            
+            assert handler in root.handlers
+        finally:
+            root.removeHandler(handler)
+    
+    @pytest.mark.asyncio
+    async def test_lifespan_without_log_handlers(self):
+        """Test the lifespan reports an inactive listener when nothing has handlers."""
+        import logging
+        from legend_guardian.api.main import lifespan
+        
+        loggers = [logging.getLogger(name) for name in ("", "uvicorn", "uvicorn.error", "uvicorn.access")]
+        
+        with patch.object(loggers[0], "handlers", []), \
+             patch.object(loggers[1], "handlers", []), \
+             patch.object(loggers[2], "handlers", []), \
+             patch.object(loggers[3], "handlers", []), \
+             patch('legend_guardian.api.main.logger') as mock_logger:
+            
+            async with lifespan(FastAPI()):
+                assert all(not target.handlers for target in loggers)
+            
+            mock_logger.warning.assert_any_call("Log queue listener inactive: no log handlers configured")
 
 
 class TestMiddleware:
@@ -134,20 +245,30 @@ class TestMiddleware:
         async def call_next(req):
             return response
         
-        with patch('time.time', return_value=1234567890.123):
-            result = await add_correlation_id(request, call_next)
-            
-            # Should generate correlation ID from timestamp
-            assert request.state.correlation_id == "1234567890.123"
-            assert result.headers["X-Correlation-ID"] == "1234567890.123"
+        result = await add_correlation_id(request, call_next)
+        
+        # Should generate a random correlation ID
+        correlation_id = request.state.correlation_id
+        assert len(correlation_id) == 32
+        int(correlation_id, 16)
+        assert result.headers["X-Correlation-ID"] == correlation_id
+        
+        # Concurrent requests never share a generated ID
+        other_request = MagicMock(spec=Request)
+        other_request.headers = {}
+        other_request.state = State()
+        await add_correlation_id(other_request, call_next)
+        assert other_request.state.correlation_id != correlation_id
     
     @pytest.mark.asyncio
     async def test_log_requests_middleware(self):
-        """Test request logging middleware."""
-        from legend_guardian.api.main import log_requests
+        """Test request logging in the correlation ID middleware."""
+        from legend_guardian.api.main import add_correlation_id
         
         # Create mock request
         request = MagicMock(spec=Request)
+        request.headers = {"X-Correlation-ID": "test-correlation-123"}
+        request.state = State()
         request.method = "GET"
         request.url = MagicMock()
         request.url.path = "/test"
@@ -156,15 +277,17 @@ class TestMiddleware:
         
         response = MagicMock()
         response.status_code = 200
+        response.headers = {}
         
         async def call_next(req):
             await asyncio.sleep(0.1)  # Simulate processing time
             return response
         
         with patch('legend_guardian.api.main.logger') as mock_logger, \
-             patch('time.time', side_effect=[1000.0, 1000.15]):
+             patch('legend_guardian.api.main.time') as mock_time:
+            mock_time.monotonic.side_effect = [1000.0, 1000.15]
             
-            result = await log_requests(request, call_next)
+            result = await add_correlation_id(request, call_next)
             
             # Check logging calls
             assert mock_logger.info.call_count == 2
@@ -181,13 +304,16 @@ class TestMiddleware:
             assert second_call[0][0] == "Request completed"
             assert second_call[1]["status_code"] == 200
             assert second_call[1]["duration_ms"] == 150.0
+            assert result.headers["X-Correlation-ID"] == "test-correlation-123"
     
     @pytest.mark.asyncio
     async def test_log_requests_middleware_no_client(self):
         """Test request logging middleware without client info."""
-        from legend_guardian.api.main import log_requests
+        from legend_guardian.api.main import add_correlation_id
         
         request = MagicMock(spec=Request)
+        request.headers = {}
+        request.state = State()
         request.method = "POST"
         request.url = MagicMock()
         request.url.path = "/api/test"
@@ -195,12 +321,13 @@ class TestMiddleware:
         
         response = MagicMock()
         response.status_code = 201
+        response.headers = {}
         
         async def call_next(req):
             return response
         
         with patch('legend_guardian.api.main.logger') as mock_logger:
-            await log_requests(request, call_next)
+            await add_correlation_id(request, call_next)
             
             # Check client is None in logs
             first_call = mock_logger.info.call_args_list[0]
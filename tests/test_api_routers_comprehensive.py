@@ -47,6 +47,17 @@ def mock_settings():
 class TestHealthRouter:
     """Comprehensive tests for health router."""
     
+    @pytest.fixture(autouse=True)
+    def reset_health_client(self):
+        """Create the app's health client afresh under each test's patches."""
+        from legend_guardian.api.routers import health
+        
+        app.state.health_client = None
+        health.reset_readiness_cache(app)
+        yield
+        app.state.health_client = None
+        health.reset_readiness_cache(app)
+    
     @pytest.mark.asyncio
     async def test_check_service_health_success(self):
         """Test successful service health check."""
@@ -123,6 +134,62 @@ class TestHealthRouter:
             assert result["status"] == "down"
             assert "Request timeout" in result["error"]
     
+    @pytest.mark.asyncio
+    async def test_check_service_health_uses_given_client(self):
+        """Test health checks run on a pooled client when one is passed."""
+        from legend_guardian.api.routers.health import check_service_health
+        
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.elapsed.total_seconds.return_value = 0.01
+        
+        with patch('httpx.AsyncClient') as mock_client_class:
+            pooled = AsyncMock()
+            pooled.get.return_value = mock_response
+            
+            await check_service_health("http://engine", "/info", client=pooled)
+            await check_service_health("http://sdlc", "/info", timeout=1.0, client=pooled)
+            
+            mock_client_class.assert_not_called()
+            pooled.get.assert_called_with("http://sdlc/info", timeout=1.0)
+    
+    def test_health_client_is_per_app(self):
+        """Test each app pools its own health client across requests."""
+        from fastapi import FastAPI
+        from legend_guardian.api.routers import health
+        
+        first_app = FastAPI()
+        first_app.include_router(health.router)
+        second_app = FastAPI()
+        second_app.include_router(health.router)
+        
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.elapsed.total_seconds.return_value = 0.01
+        
+        with patch('httpx.AsyncClient') as mock_client_class:
+            mock_client_class.side_effect = lambda **kwargs: AsyncMock(get=AsyncMock(return_value=mock_response))
+            
+            first = TestClient(first_app)
+            first.get("/health")
+            first.get("/health")
+            TestClient(second_app).get("/health")
+            
+            assert mock_client_class.call_count == 2
+            assert first_app.state.health_client is not second_app.state.health_client
+    
+    def test_health_client_closed_on_shutdown(self):
+        """Test the lifespan creates the app's health client and closes it on shutdown."""
+        with patch('httpx.AsyncClient') as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            
+            with TestClient(app):
+                assert app.state.health_client is mock_client
+            
+            assert app.state.health_client is None
+            mock_client.aclose.assert_awaited_once()
+    
     def test_health_check_endpoint(self, client, mock_settings):
         """Test main health check endpoint."""
         with patch('legend_guardian.api.routers.health.get_settings', return_value=mock_settings), \
@@ -273,6 +340,63 @@ class TestHealthRouter:
             assert response.status_code == 200
             data = response.json()
             assert data["status"] == "not_ready"
+    
+    def test_readiness_probe_reuses_recent_result(self, client):
+        """Test readiness probe answers repeat probes from its cache."""
+        with patch('httpx.AsyncClient') as mock_client_class:
+            
+            mock_client = AsyncMock()
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_client.get.return_value = mock_response
+            mock_client_class.return_value = mock_client
+            
+            first = client.get("/health/ready")
+            second = client.get("/health/ready")
+            
+            assert first.json() == second.json() == {"status": "ready"}
+            # One engine and one SDLC check for both probes
+            assert mock_client.get.call_count == 2
+    
+    def test_readiness_cache_is_per_app(self):
+        """Test that a new app does not see another app's cached readiness."""
+        from fastapi import FastAPI
+        from legend_guardian.api.routers import health
+        
+        first_app = FastAPI()
+        first_app.include_router(health.router)
+        second_app = FastAPI()
+        second_app.include_router(health.router)
+        
+        with patch('httpx.AsyncClient') as mock_client_class:
+            
+            mock_client = AsyncMock()
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_client.get.return_value = mock_response
+            mock_client_class.return_value = mock_client
+            
+            assert TestClient(first_app).get("/health/ready").json() == {"status": "ready"}
+            
+            mock_client.get.side_effect = httpx.ConnectError("Connection refused")
+            
+            assert TestClient(second_app).get("/health/ready").json() == {"status": "not_ready"}
+    
+    def test_readiness_cache_cleared_on_shutdown(self):
+        """Test that app shutdown drops the cached readiness result."""
+        with patch('httpx.AsyncClient') as mock_client_class:
+            
+            mock_client = AsyncMock()
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_client.get.return_value = mock_response
+            mock_client_class.return_value = mock_client
+            
+            with TestClient(app) as lifespan_client:
+                lifespan_client.get("/health/ready")
+                assert app.state.readiness_cache.entry is not None
+            
+            assert app.state.readiness_cache is None
 
 
 class TestIntentRouter:
@@ -318,6 +442,82 @@ class TestIntentRouter:
         finally:
             # Clean up the override
             app.dependency_overrides.clear()
+    
+    def test_process_intent_stops_after_failed_wave(self, client):
+        """Test steps run wave by wave and stop after a failure."""
+        from legend_guardian.api.deps import verify_api_key
+        from legend_guardian.api.main import app
+        
+        app.dependency_overrides[verify_api_key] = lambda: "test-key"
+        
+        async def fake_execute(action, params):
+            if action == "create_model":
+                raise ValueError("invalid model")
+            return {"log": f"{action} done"}
+        
+        try:
+            with patch('legend_guardian.api.routers.intent.AgentOrchestrator') as mock_orch_class:
+                mock_orch = mock_orch_class.return_value
+                mock_orch.parse_intent = AsyncMock(return_value=[
+                    {"action": "search_depot", "params": {}},
+                    {"action": "compile", "params": {}},
+                    {"action": "create_model", "params": {}},
+                    {"action": "open_review", "params": {}},
+                ])
+                mock_orch.plan_waves.return_value = [[0, 1], [2], [3]]
+                mock_orch.execute_step = AsyncMock(side_effect=fake_execute)
+                
+                response = client.post("/intent/", json={"prompt": "Import and review"})
+                
+                assert response.status_code == 200
+                data = response.json()
+                assert data["status"] == "failed"
+                assert [step["status"] for step in data["plan"]] == [
+                    "completed", "completed", "failed", "pending"
+                ]
+                assert data["plan"][2]["error"] == "invalid model"
+                assert data["logs"] == ["search_depot done", "compile done"]
+                assert mock_orch.execute_step.await_count == 3
+        finally:
+            app.dependency_overrides.clear()
+    
+    def test_process_intent_overlaps_read_only_steps(self, client):
+        """Test adjacent read-only steps run together and writes act as barriers."""
+        from legend_guardian.agent.orchestrator import AgentOrchestrator
+        from legend_guardian.api.deps import verify_api_key
+        from legend_guardian.api.main import app
+        
+        app.dependency_overrides[verify_api_key] = lambda: "test-key"
+        events = []
+        
+        async def fake_execute(self, action, params):
+            events.append(("start", action))
+            await asyncio.sleep(0.01)
+            events.append(("end", action))
+            return {"log": action}
+        
+        plan = [
+            {"action": "search_depot", "params": {"query": "trade"}},
+            {"action": "transform_schema", "params": {}},
+            {"action": "create_model", "params": {"name": "Trade"}},
+            {"action": "publish", "params": {}, "requires_approval": True},
+        ]
+        
+        try:
+            with patch.object(AgentOrchestrator, 'parse_intent', AsyncMock(return_value=plan)), \
+                 patch.object(AgentOrchestrator, 'execute_step', fake_execute):
+                
+                response = client.post("/intent/", json={"prompt": "Import a trade model"})
+                
+                assert response.status_code == 200
+                assert response.json()["logs"] == ["search_depot", "transform_schema", "create_model", "publish"]
+                # Both read-only steps start before either finishes
+                assert events[:2] == [("start", "search_depot"), ("start", "transform_schema")]
+                # The write starts only after the read-only wave has finished
+                assert events.index(("start", "create_model")) == 4
+                assert events[-2:] == [("start", "publish"), ("end", "publish")]
+        finally:
+            app.dependency_overrides.clear()
 
 
 class TestWebhooksRouter:
@@ -598,7 +798,7 @@ class TestAdapterRouters:
     
     def test_engine_compile(self, client):
         """Test Engine compile endpoint."""
-        from legend_guardian.api.deps import verify_api_key, get_correlation_id
+        from legend_guardian.api.deps import verify_api_key, get_correlation_id, get_engine_client
         from legend_guardian.api.main import app
         
         compile_data = {
@@ -607,121 +807,256 @@ class TestAdapterRouters:
             "workspace_id": "test-workspace"
         }
         
+        # Mock the shared client and its methods
+        mock_client = AsyncMock()
+        mock_client.compile = AsyncMock(return_value={
+            "status": "success",
+            "details": {"compiled": True},
+            "errors": []
+        })
+        
         # Override dependencies
         app.dependency_overrides[verify_api_key] = lambda: "test-api-key"
         app.dependency_overrides[get_correlation_id] = lambda: "test-correlation-id"
+        app.dependency_overrides[get_engine_client] = lambda: mock_client
         
         try:
-            with patch('legend_guardian.api.routers.adapters_engine.EngineClient') as mock_client_class:
-                # Mock the client instance and its methods
-                mock_client = AsyncMock()
-                mock_client.compile = AsyncMock(return_value={
-                    "status": "success",
-                    "details": {"compiled": True},
-                    "errors": []
-                })
-                mock_client_class.return_value = mock_client
-                
-                response = client.post(
-                    "/adapters/engine/compile",
-                    json=compile_data
-                )
-                
-                assert response.status_code == 200
-                data = response.json()
-                assert data["ok"] is True
-                assert "details" in data
-                
-                # Verify the client was instantiated and called correctly
-                mock_client_class.assert_called_once()
-                mock_client.compile.assert_called_once_with(
-                    pure=compile_data["pure"],
-                    project_id=compile_data["project_id"],
-                    workspace_id=compile_data["workspace_id"]
-                )
+            response = client.post(
+                "/adapters/engine/compile",
+                json=compile_data
+            )
+            
+            assert response.status_code == 200
+            data = response.json()
+            assert data["ok"] is True
+            assert "details" in data
+            
+            mock_client.compile.assert_called_once_with(
+                pure=compile_data["pure"],
+                project_id=compile_data["project_id"],
+                workspace_id=compile_data["workspace_id"]
+            )
         finally:
             # Clean up overrides
             app.dependency_overrides.clear()
     
     def test_sdlc_list_projects(self, client):
         """Test SDLC list projects endpoint."""
-        from legend_guardian.api.deps import verify_api_key, get_correlation_id
+        from legend_guardian.api.deps import verify_api_key, get_correlation_id, get_sdlc_client
         from legend_guardian.api.main import app
         
+        # Mock the shared client and its methods
+        mock_client = AsyncMock()
+        mock_client.list_projects = AsyncMock(return_value=[
+            {
+                "projectId": "test-project-123",
+                "name": "Test Project",
+                "description": "A test project",
+                "groupId": "com.example",
+                "artifactId": "test-project"
+            }
+        ])
+        
         # Override dependencies
         app.dependency_overrides[verify_api_key] = lambda: "test-api-key"
         app.dependency_overrides[get_correlation_id] = lambda: "test-correlation-id"
+        app.dependency_overrides[get_sdlc_client] = lambda: mock_client
         
         try:
-            with patch('legend_guardian.api.routers.adapters_sdlc.SDLCClient') as mock_client_class:
-                # Mock the client instance and its methods
-                mock_client = AsyncMock()
-                mock_client.list_projects = AsyncMock(return_value=[
-                    {
-                        "projectId": "test-project-123",
-                        "name": "Test Project",
-                        "description": "A test project",
-                        "groupId": "com.example",
-                        "artifactId": "test-project"
-                    }
-                ])
-                mock_client_class.return_value = mock_client
-                
-                response = client.get("/adapters/sdlc/projects")
-                
-                assert response.status_code == 200
-                data = response.json()
-                assert len(data) == 1
-                assert data[0]["projectId"] == "test-project-123"
-                assert data[0]["name"] == "Test Project"
-                
-                # Verify the client was instantiated and called correctly
-                mock_client_class.assert_called_once()
-                mock_client.list_projects.assert_called_once()
+            response = client.get("/adapters/sdlc/projects")
+            
+            assert response.status_code == 200
+            data = response.json()
+            assert len(data) == 1
+            assert data[0]["projectId"] == "test-project-123"
+            assert data[0]["name"] == "Test Project"
+            
+            # Verify the shared client was called correctly
+            mock_client.list_projects.assert_called_once()
         finally:
             # Clean up overrides
             app.dependency_overrides.clear()
     
+    def test_sdlc_upsert_entities(self, client):
+        """Test SDLC upsert sends plain entity dicts."""
+        from legend_guardian.api.deps import verify_api_key, get_correlation_id, get_sdlc_client
+        from legend_guardian.api.main import app
+        
+        mock_client = AsyncMock()
+        mock_client.upsert_entities = AsyncMock(return_value={"revision": "abc"})
+        
+        app.dependency_overrides[verify_api_key] = lambda: "test-api-key"
+        app.dependency_overrides[get_correlation_id] = lambda: "test-correlation-id"
+        app.dependency_overrides[get_sdlc_client] = lambda: mock_client
+        
+        entity = {
+            "path": "model::Person",
+            "classifier_path": "meta::pure::metamodel::type::Class",
+            "content": {"name": "Person"}
+        }
+        
+        try:
+            response = client.post(
+                "/adapters/sdlc/entities",
+                params={"project_id": "proj", "workspace_id": "ws"},
+                json={"replace": True, "entities": [entity]}
+            )
+            
+            assert response.status_code == 200
+            assert response.json()["entities_processed"] == 1
+            mock_client.upsert_entities.assert_called_once_with(
+                project_id="proj",
+                workspace_id="ws",
+                entities=[entity],
+                replace=True
+            )
+        finally:
+            app.dependency_overrides.clear()
+    
     def test_depot_search(self, client):
         """Test Depot search endpoint."""
-        from legend_guardian.api.deps import verify_api_key, get_correlation_id
+        from legend_guardian.api.deps import verify_api_key, get_correlation_id, get_depot_client
         from legend_guardian.api.main import app
         
+        # Mock the shared client and its methods
+        mock_client = AsyncMock()
+        mock_client.search = AsyncMock(return_value=[
+            {
+                "groupId": "com.example",
+                "artifactId": "shared-model",
+                "version": "1.0.0",
+                "entities": ["Person", "Address"]
+            }
+        ])
+        
         # Override dependencies
         app.dependency_overrides[verify_api_key] = lambda: "test-api-key"
         app.dependency_overrides[get_correlation_id] = lambda: "test-correlation-id"
+        app.dependency_overrides[get_depot_client] = lambda: mock_client
         
         try:
-            with patch('legend_guardian.api.routers.adapters_depot.DepotClient') as mock_client_class:
-                # Mock the client instance and its methods
-                mock_client = AsyncMock()
-                mock_client.search = AsyncMock(return_value=[
-                    {
-                        "groupId": "com.example",
-                        "artifactId": "shared-model",
-                        "version": "1.0.0",
-                        "entities": ["Person", "Address"]
-                    }
-                ])
-                mock_client_class.return_value = mock_client
-                
-                response = client.get(
-                    "/adapters/depot/search",
-                    params={"q": "Person", "limit": 20}
-                )
-                
-                assert response.status_code == 200
-                data = response.json()
-                assert len(data) == 1
-                assert data[0]["groupId"] == "com.example"
-                assert data[0]["artifactId"] == "shared-model"
-                
-                # Verify the client was instantiated and called correctly
-                mock_client_class.assert_called_once()
-                mock_client.search.assert_called_once_with(
-                    query="Person",
-                    limit=20
-                )
+            response = client.get(
+                "/adapters/depot/search",
+                params={"q": "Person", "limit": 20}
+            )
+            
+            assert response.status_code == 200
+            data = response.json()
+            assert len(data) == 1
+            assert data[0]["groupId"] == "com.example"
+            assert data[0]["artifactId"] == "shared-model"
+            
+            # Verify the shared client was called correctly
+            mock_client.search.assert_called_once_with(
+                query="Person",
+                limit=20
+            )
         finally:
             # Clean up overrides
+            app.dependency_overrides.clear()
+    
+    def test_sdlc_get_entities_streams_body(self, client):
+        """Test SDLC entities endpoint passes the upstream body through."""
+        from legend_guardian.api.deps import verify_api_key, get_correlation_id, get_sdlc_client
+        from legend_guardian.api.main import app
+        
+        body = b'[{"path": "model::Person", "content": {"name": "Person"}}]'
+        upstream = httpx.Response(
+            200,
+            content=body,
+            headers={"content-type": "application/vnd.legend+json"},
+        )
+        
+        mock_client = AsyncMock()
+        mock_client.stream_entities = AsyncMock(return_value=upstream)
+        
+        app.dependency_overrides[verify_api_key] = lambda: "test-api-key"
+        app.dependency_overrides[get_correlation_id] = lambda: "test-correlation-id"
+        app.dependency_overrides[get_sdlc_client] = lambda: mock_client
+        
+        try:
+            response = client.get("/adapters/sdlc/entities?project_id=proj1&workspace_id=ws1")
+            
+            assert response.status_code == 200
+            assert response.content == body
+            assert response.headers["content-type"] == "application/vnd.legend+json"
+            mock_client.stream_entities.assert_called_once_with(
+                project_id="proj1",
+                workspace_id="ws1",
+            )
+            assert upstream.is_closed
+        finally:
+            app.dependency_overrides.clear()
+    
+    @pytest.mark.asyncio
+    async def test_sdlc_get_entities_closes_unread_response(self):
+        """Test the entities response closes upstream even if no chunk is ever sent."""
+        from legend_guardian.api.routers.adapters_sdlc import get_entities
+        
+        upstream = httpx.Response(200, content=b"[]")
+        mock_client = AsyncMock()
+        mock_client.stream_entities = AsyncMock(return_value=upstream)
+        
+        response = await get_entities(
+            project_id="proj1",
+            workspace_id="ws1",
+            api_key="test-api-key",
+            correlation_id="test-correlation-id",
+            client=mock_client,
+        )
+        
+        # A disconnect before the first chunk never starts the body generator
+        await response.background()
+        
+        assert upstream.is_closed
+    
+    @pytest.mark.asyncio
+    async def test_sdlc_stream_body_closes_abandoned_response(self):
+        """Test the entities stream closes upstream when the client stops reading."""
+        from legend_guardian.api.routers.adapters_sdlc import _stream_body
+        
+        async def chunks():
+            yield b'[{"path": "model::A"},'
+            yield b'{"path": "model::B"}]'
+        
+        upstream = MagicMock()
+        upstream.aiter_bytes = chunks
+        upstream.aclose = AsyncMock()
+        
+        stream = _stream_body(upstream)
+        assert await stream.__anext__() == b'[{"path": "model::A"},'
+        await stream.aclose()
+        
+        upstream.aclose.assert_awaited_once()
+    
+    def test_depot_project_entities(self, client):
+        """Test Depot entities endpoint adds project and version."""
+        from legend_guardian.api.deps import verify_api_key, get_correlation_id, get_depot_client
+        from legend_guardian.api.main import app
+        
+        mock_client = AsyncMock()
+        mock_client.get_entities = AsyncMock(return_value=[
+            {
+                "path": "model::Person",
+                "classifier_path": "meta::pure::metamodel::type::Class",
+                "content": {"name": "Person"}
+            }
+        ])
+        
+        app.dependency_overrides[verify_api_key] = lambda: "test-api-key"
+        app.dependency_overrides[get_correlation_id] = lambda: "test-correlation-id"
+        app.dependency_overrides[get_depot_client] = lambda: mock_client
+        
+        try:
+            response = client.get("/adapters/depot/projects/proj1/versions/1.0.0/entities")
+            
+            assert response.status_code == 200
+            assert response.json() == [{
+                "path": "model::Person",
+                "classifier_path": "meta::pure::metamodel::type::Class",
+                "content": {"name": "Person"},
+                "project_id": "proj1",
+                "version": "1.0.0"
+            }]
+        finally:
             app.dependency_overrides.clear()
\ No newline at end of file
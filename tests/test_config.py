@@ -11,3 +11,8 @@ def test_config_has_expected_attributes():
     assert hasattr(s, "engine_url")
     assert hasattr(s, "rag_enabled")
     assert hasattr(s, "max_request_size")
+
+
+def test_get_settings_is_cached():
+    assert config.get_settings() is config.get_settings()
+    assert config.get_settings() is config.settings
@@ -335,7 +335,7 @@ async def test_request_with_error(depot_client):
     """Test _request with error response."""
     with patch('httpx.AsyncClient') as mock_client_class:
         mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
         
         mock_response = MagicMock()
         mock_response.status_code = 404
@@ -353,7 +353,7 @@ async def test_request_with_json_response(depot_client):
     """Test _request with JSON response."""
     with patch('httpx.AsyncClient') as mock_client_class:
         mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
         
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -371,7 +371,7 @@ async def test_request_with_text_response(depot_client):
     """Test _request with text response."""
     with patch('httpx.AsyncClient') as mock_client_class:
         mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
         
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -389,7 +389,7 @@ async def test_request_retry_on_failure(depot_client):
     """Test that _request retries on failure."""
     with patch('httpx.AsyncClient') as mock_client_class:
         mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
         
         # First two calls fail, third succeeds
         mock_response_fail = MagicMock()
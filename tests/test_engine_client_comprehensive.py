@@ -290,7 +290,7 @@ async def test_request_with_error(engine_client):
     """Test _request with error response."""
     with patch('httpx.AsyncClient') as mock_client_class:
         mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
         
         mock_response = MagicMock()
         mock_response.status_code = 400
@@ -308,7 +308,7 @@ async def test_request_with_json_response(engine_client):
     """Test _request with JSON response."""
     with patch('httpx.AsyncClient') as mock_client_class:
         mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
         
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -326,7 +326,7 @@ async def test_request_with_text_response(engine_client):
     """Test _request with text response."""
     with patch('httpx.AsyncClient') as mock_client_class:
         mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
         
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -344,7 +344,7 @@ async def test_request_retry_logic(engine_client):
     """Test request retry logic on failure."""
     with patch('httpx.AsyncClient') as mock_client_class:
         mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
         
         # First call times out, second succeeds
         mock_response = MagicMock()
@@ -6,7 +6,7 @@ import json
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
-from legend_guardian.agent.memory import MemoryStore
+from legend_guardian.agent.memory import MemoryStore, utc_now_iso
 
 
 @pytest.fixture
@@ -288,4 +288,37 @@ def test_find_similar_episodes(memory_store):
         assert "model" in result["prompt"].lower() or "create" in result["prompt"].lower()
 
 
+def test_utc_now_iso_format():
+    """Test cached timestamps keep the utcnow isoformat shape."""
+    timestamp = utc_now_iso()
+    parsed = datetime.fromisoformat(timestamp)
+    
+    assert parsed.tzinfo is None
+    assert abs((datetime.utcnow() - parsed).total_seconds()) < 5
+
+
+def test_existing_timestamp_is_kept(memory_store):
+    """Test provided timestamps are not overwritten."""
+    memory_store.add_episode({"prompt": "test", "timestamp": "2023-01-01T00:00:00"})
+    memory_store.add_action({"type": "test", "timestamp": "2023-01-01T00:00:00"})
+    
+    assert memory_store.episodes[0]["timestamp"] == "2023-01-01T00:00:00"
+    assert memory_store.actions[0]["timestamp"] == "2023-01-01T00:00:00"
+
+
+def test_history_is_capped():
+    """Test episodes and actions are trimmed to the configured size."""
+    store = MemoryStore(max_episodes=3)
+    episodes = store.episodes
+    
+    for i in range(5):
+        store.add_episode({"id": i})
+    for i in range(40):
+        store.add_action({"action": f"step-{i}"})
+    
+    assert store.episodes is episodes
+    assert [episode["id"] for episode in store.episodes] == [2, 3, 4]
+    assert len(store.actions) == 30
+    assert store.actions[0]["action"] == "step-10"
+
 # Episode and Action classes don't exist in the actual implementation
\ No newline at end of file
@@ -165,6 +165,12 @@ class TestExecuteStep:
         
         assert "Unknown action" in str(exc_info.value)
     
+    def test_handler_names_resolve(self, orchestrator):
+        """Test every routed action maps to an orchestrator coroutine."""
+        for action, handler_name in orchestrator._HANDLER_NAMES.items():
+            handler = getattr(orchestrator, handler_name)
+            assert callable(handler), action
+    
     @pytest.mark.asyncio
     async def test_execute_with_validation(self, orchestrator):
         """Test step execution with validation."""
@@ -597,4 +603,107 @@ class TestComplexWorkflows:
                     assert "imported" in result
                     assert result["imported"] is True
                     assert "entities" in result
-                    assert len(result["entities"]) > 0
\ No newline at end of file
+                    assert len(result["entities"]) > 0
+
+
+class TestSchemaAnalysis:
+    """Tests for table analysis with LLM schema enhancement."""
+    
+    @pytest.mark.asyncio
+    async def test_analyze_table_without_enhancement(self, orchestrator):
+        """Test table analysis when the LLM client cannot enhance schemas."""
+        result = await orchestrator._analyze_table({"table": "trades"})
+        
+        assert result["table"] == "trades"
+        assert result["primary_key"] == "trade_id"
+        assert len(result["columns"]) == 5
+    
+    def test_generate_pure_from_schema(self, orchestrator):
+        """Test PURE generation from columns and known constraints."""
+        columns = [
+            {"name": "id", "type": "INTEGER", "nullable": False},
+            {"name": "ticker", "type": "VARCHAR(10)"},
+        ]
+        
+        pure = orchestrator._generate_pure_from_schema("Position", columns, ["qtyPositive", "unknown"])
+        
+        assert pure == (
+            "Class model::Position\n{\n"
+            "  id: Integer[1];\n"
+            "  ticker: String[0..1];\n"
+            "  constraint qtyPositive: $this.quantity > 0;\n"
+            "}"
+        )
+
+
+class TestExecutePlan:
+    """Tests for plan execution."""
+    
+    def test_plan_waves(self, orchestrator):
+        """Test grouping of plan steps into concurrent waves."""
+        steps = [
+            {"action": "compile"},
+            {"action": "run_tests"},
+            {"action": "create_model"},
+            {"action": "search_depot", "requires_approval": True},
+            {"action": "analyze_table"},
+        ]
+        
+        assert orchestrator.plan_waves(steps) == [[0, 1], [2], [3], [4]]
+        assert orchestrator.plan_waves([]) == []
+
+
+class TestPureConversion:
+    """Tests for entity to PURE conversion."""
+    
+    def test_entities_to_pure(self, orchestrator):
+        """Test converting classes and mappings, skipping unknown entities."""
+        entities = [
+            {
+                "classifierPath": "meta::pure::metamodel::type::Class",
+                "content": {
+                    "name": "Trade",
+                    "package": "model",
+                    "properties": [
+                        {"name": "id", "type": "Integer", "multiplicity": {"lowerBound": 1, "upperBound": 1}},
+                        {"name": "tags", "multiplicity": {"lowerBound": 0, "upperBound": "*"}},
+                    ],
+                },
+            },
+            {"classifierPath": "meta::pure::runtime::Runtime", "content": {}},
+            {"classifierPath": "meta::pure::mapping::Mapping", "content": {"name": "TradeMapping"}},
+        ]
+        
+        pure = orchestrator._entities_to_pure(entities)
+        
+        assert pure == (
+            "Class model::Trade\n{\n"
+            "  id: Integer[1..1];\n"
+            "  tags: String[0..*];\n"
+            "}\n\n"
+            "Mapping mapping::TradeMapping\n(\n"
+            "  // Mapping implementation\n"
+            ")"
+        )
+    
+    def test_entities_to_pure_empty_class(self, orchestrator):
+        """Test converting a class without properties."""
+        entities = [{"classifierPath": "meta::pure::metamodel::type::Class", "content": {}}]
+        
+        assert orchestrator._entities_to_pure(entities) == "Class model::UnknownClass\n{\n\n}"
+        assert orchestrator._entities_to_pure([]) == ""
+    
+    def test_csv_header_drives_model(self, orchestrator):
+        """Test that CSV conversion only uses the header line."""
+        csv_data = "\n id , ticker,quantity\r\n" + "1,AAPL,10\n" * 1000
+        
+        assert orchestrator._parse_csv_header(csv_data) == ["id", "ticker", "quantity"]
+        assert orchestrator._generate_pure_from_csv("Trade", csv_data) == (
+            "Class model::Trade\n{\n"
+            "  id: String[1];\n"
+            "  ticker: String[1];\n"
+            "  quantity: String[1];\n"
+            "}"
+        )
+        properties = orchestrator._extract_properties_from_csv(csv_data)
+        assert [p["name"] for p in properties] == ["id", "ticker", "quantity"]
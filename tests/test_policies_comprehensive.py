@@ -3,6 +3,7 @@
 import pytest
 from unittest.mock import patch, mock_open
 import json
+import re
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
@@ -82,6 +83,26 @@ def test_load_policies_from_malformed_file():
         assert "pii_patterns" in engine.policies
 
 
+def test_load_policies_from_file_is_cached(tmp_path):
+    """Test unchanged policy files are parsed once and not shared."""
+    policy_path = tmp_path / "policies.yaml"
+    policy_path.write_text("require_approval:\n  - delete\n")
+    
+    first = PolicyEngine(policy_file=str(policy_path))
+    first.policies["require_approval"].append("merge")
+    
+    with patch('builtins.open', side_effect=AssertionError("re-read")):
+        second = PolicyEngine(policy_file=str(policy_path))
+    assert second.policies["require_approval"] == ["delete"]
+    
+    # A newer file is parsed again
+    policy_path.write_text("require_approval:\n  - publish\n")
+    stat = policy_path.stat()
+    os.utime(policy_path, (stat.st_atime, stat.st_mtime + 10))
+    third = PolicyEngine(policy_file=str(policy_path))
+    assert third.policies["require_approval"] == ["publish"]
+
+
 @pytest.mark.asyncio
 async def test_check_action_allow(policy_engine):
     """Test checking action that should be allowed."""
@@ -620,4 +641,98 @@ def test_get_policy_summary_comprehensive(policy_engine):
     assert "dangerous_op" in summary["prohibited_actions"]
     assert "deploy" in summary["approval_required"]
     assert "max_entities" in summary["limits"]
-    assert "max_title_length" in summary["limits"]
\ No newline at end of file
+    assert "max_title_length" in summary["limits"]
+
+
+@pytest.mark.asyncio
+async def test_update_policy_recompiles_patterns(policy_engine):
+    """Test that updated regex policies take effect immediately."""
+    await policy_engine.check_action("create_model", {"name": "Trade"})
+    
+    policy_engine.update_policy("naming_rules", {"model": r"^[a-z]+$"})
+    with pytest.raises(ValueError, match="violates naming policy"):
+        await policy_engine.check_action("create_model", {"name": "Trade"})
+    
+    policy_engine.update_policy("pii_patterns", [r"secret"])
+    assert policy_engine.redact_pii("my secret, user@example.com") == "my [REDACTED], user@example.com"
+    with pytest.raises(ValueError, match="PII detected"):
+        await policy_engine.check_action("compile", {"note": "top secret"})
+
+
+@pytest.mark.asyncio
+async def test_pii_patterns_keep_their_meaning_when_not_joinable(policy_engine):
+    """Test inline flags and backreferences still work pattern by pattern."""
+    policy_engine.update_policy("pii_patterns", [r"(?i)ssn-\d+", r"\b(\d)\1{3}\b"])
+    
+    assert policy_engine._pii_pattern is None
+    assert policy_engine.redact_pii("SSN-42 and 7777 but not 1234") == "[REDACTED] and [REDACTED] but not 1234"
+    await policy_engine.check_action("compile", {"note": "1234"})
+    with pytest.raises(ValueError, match="PII detected"):
+        await policy_engine.check_action("compile", {"note": "ssn-9"})
+
+
+def test_default_pii_patterns_are_joined(policy_engine):
+    """Test the group-free default patterns share one fused regex."""
+    assert policy_engine._pii_pattern is not None
+    assert len(policy_engine._pii_patterns) == 4
+
+
+def test_invalid_pii_pattern_is_rejected(policy_engine):
+    """Test an invalid pattern fails on its own when policies are compiled."""
+    with pytest.raises(re.error):
+        policy_engine.update_policy("pii_patterns", [r"email", r"(unclosed"])
+
+
+@pytest.mark.asyncio
+async def test_update_policy_refreshes_action_sets(policy_engine):
+    """Test that updated approval and schema lists take effect immediately."""
+    policy_engine.update_policy("require_approval", ["compile"])
+    steps = await policy_engine.validate_plan([{"action": "compile", "params": {}}])
+    assert steps[0]["requires_approval"] is True
+    
+    policy_engine.update_policy("allowed_schema_types", ["avro"])
+    await policy_engine.check_action("transform_schema", {"format": "avro"})
+    with pytest.raises(ValueError, match="not allowed"):
+        await policy_engine.check_action("transform_schema", {"format": "jsonSchema"})
+
+
+def test_check_pii_scalars_and_subclasses(policy_engine):
+    """Test scalar leaves are skipped and container subclasses still scanned."""
+    from collections import OrderedDict
+    
+    policy_engine._check_pii({"lower": 1, "upper": None, "flag": True, "ratio": 0.5})
+    
+    with pytest.raises(ValueError, match="PII detected"):
+        policy_engine._check_pii(OrderedDict(owner="user@example.com"))
+    
+    class Tag(str):
+        pass
+    
+    with pytest.raises(ValueError, match="PII detected"):
+        policy_engine._check_pii({"tags": [Tag("user@example.com")]})
+
+
+def test_check_pii_deeply_nested(policy_engine):
+    """Test PII detection in parameters nested beyond the recursion limit."""
+    data = {"value": "user@example.com"}
+    for _ in range(sys.getrecursionlimit() + 100):
+        data = {"nested": [data]}
+    
+    with pytest.raises(ValueError, match="PII detected"):
+        policy_engine._check_pii(data)
+
+
+def test_check_pii_reuses_string_verdicts(policy_engine):
+    """Test that repeated strings are only scanned once per pattern set."""
+    params = {"entities": [{"package": "model::trading"} for _ in range(10)]}
+    
+    policy_engine._check_pii(params)
+    policy_engine._check_pii(params)
+    
+    info = policy_engine._contains_pii.cache_info()
+    assert info.misses == 1
+    assert info.hits == 19
+    
+    policy_engine.update_policy("pii_patterns", [r"trading"])
+    with pytest.raises(ValueError, match="PII detected"):
+        policy_engine._check_pii(params)
@@ -1,3 +1,4 @@
+import json
 import pytest
 import sys
 import os
@@ -8,3 +9,56 @@ def test_store_has_expected_methods():
     assert hasattr(store, "VectorStore")
     vs = store.VectorStore()
     assert hasattr(vs, "add_documents")
+
+
+@pytest.mark.asyncio
+async def test_unchanged_documents_are_not_persisted_again(tmp_path):
+    persist_path = tmp_path / "store.json"
+    vs = store.VectorStore(persist_path=str(persist_path))
+    doc = {"path": "docs/a.md", "content": "alpha"}
+    
+    await vs.add_documents([doc])
+    assert persist_path.exists()
+    persist_path.unlink()
+    
+    await vs.add_documents([dict(doc)])
+    await vs.delete_documents(["docs/missing.md"])
+    assert not persist_path.exists()
+    
+    await vs.add_documents([{"path": "docs/a.md", "content": "beta"}])
+    assert persist_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_document_edited_in_place_is_updated(tmp_path):
+    persist_path = tmp_path / "store.json"
+    vs = store.VectorStore(persist_path=str(persist_path))
+    doc = {"path": "docs/a.md", "content": "alpha"}
+    await vs.add_documents([doc])
+    assert await vs.query("alpha") == [doc]
+    
+    doc["content"] = "beta"
+    await vs.add_documents([doc])
+    
+    assert await vs.query("beta") == [doc]
+    assert json.loads(persist_path.read_text())["docs/a.md"]["content"] == "beta"
+
+
+@pytest.mark.asyncio
+async def test_query_batch_matches_individual_queries():
+    vs = store.VectorStore()
+    await vs.add_documents([
+        {"path": "a.md", "content": "Trade trade position", "type": "md"},
+        {"path": "b.md", "content": "Position service", "type": "md"},
+        {"path": "c.json", "content": {"name": "Trade"}, "type": "json"},
+    ])
+    
+    queries = ["trade", "position", "missing"]
+    batch = await vs.query_batch(queries, top_k=2)
+    
+    assert batch == [await vs.query(q, top_k=2) for q in queries]
+    assert [doc["path"] for doc in batch[0]] == ["a.md", "c.json"]
+    assert batch[2] == []
+    
+    filtered = await vs.query_batch(["trade"], filters={"type": "json"})
+    assert [doc["path"] for doc in filtered[0]] == ["c.json"]
@@ -236,6 +236,44 @@ async def test_get_entities_main(sdlc_client):
         assert result == []
 
 
+@pytest.mark.asyncio
+async def test_stream_entities(sdlc_client):
+    """Test stream_entities leaves the body unread for the caller."""
+    import httpx
+    
+    body = b'[{"path": "model::Entity1"}]'
+    
+    def handler(request):
+        assert request.url.path == "/api/projects/proj1/workspaces/ws1/entities"
+        assert request.headers["Authorization"] == "Bearer test-token"
+        return httpx.Response(200, content=body)
+    
+    sdlc_client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    
+    response = await sdlc_client.stream_entities("proj1", "ws1")
+    try:
+        chunks = [chunk async for chunk in response.aiter_bytes()]
+    finally:
+        await response.aclose()
+    
+    assert b"".join(chunks) == body
+
+
+@pytest.mark.asyncio
+async def test_stream_entities_error(sdlc_client):
+    """Test stream_entities raises on an error status."""
+    import httpx
+    
+    transport = httpx.MockTransport(lambda request: httpx.Response(404, text="Not found"))
+    sdlc_client._client = httpx.AsyncClient(transport=transport)
+    
+    # The method has retry decorator, so it will raise RetryError after 3 attempts
+    from tenacity import RetryError
+    with patch('asyncio.sleep', new_callable=AsyncMock):
+        with pytest.raises(RetryError):
+            await sdlc_client.stream_entities("proj1", "ws1")
+
+
 # get_entity doesn't exist - use upsert_entities instead
 
 
@@ -334,7 +372,7 @@ async def test_request_with_error(sdlc_client):
     """Test _request with error response."""
     with patch('httpx.AsyncClient') as mock_client_class:
         mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
         
         mock_response = MagicMock()
         mock_response.status_code = 404
@@ -352,7 +390,7 @@ async def test_request_with_json_response(sdlc_client):
     """Test _request with JSON response."""
     with patch('httpx.AsyncClient') as mock_client_class:
         mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
         
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -370,7 +408,7 @@ async def test_request_retry(sdlc_client):
     """Test _request retry logic."""
     with patch('httpx.AsyncClient') as mock_client_class:
         mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
         
         # First call fails, second succeeds
         mock_response_fail = MagicMock()
@@ -390,4 +428,30 @@ async def test_request_retry(sdlc_client):
         result = await sdlc_client._request("GET", "/api/test")
         
         assert result == {"status": "success"}
-        assert mock_client.request.call_count == 2
\ No newline at end of file
+        assert mock_client.request.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_request_reuses_pooled_client(sdlc_client):
+    """Test that requests share one HTTP client until it is closed."""
+    with patch('httpx.AsyncClient') as mock_client_class:
+        mock_client = AsyncMock()
+        mock_client_class.return_value = mock_client
+        
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"content-type": "application/json"}
+        mock_response.json.return_value = {"key": "value"}
+        mock_client.request.return_value = mock_response
+        
+        await sdlc_client._request("GET", "/api/info")
+        await sdlc_client._request("GET", "/api/projects")
+        
+        assert mock_client_class.call_count == 1
+        assert mock_client.request.call_count == 2
+        
+        await sdlc_client.aclose()
+        mock_client.aclose.assert_awaited_once()
+        
+        await sdlc_client._request("GET", "/api/info")
+        assert mock_client_class.call_count == 2
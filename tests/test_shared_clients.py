@@ -0,0 +1,76 @@
+"""Tests for the process-wide Legend client bundle."""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+from legend_guardian.agent.orchestrator import AgentOrchestrator
+from legend_guardian.api.deps import get_depot_client, get_engine_client, get_sdlc_client
+from legend_guardian.clients import shared
+from legend_guardian.clients.shared import close_legend_clients, get_legend_clients
+from legend_guardian.config import Settings
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_clients():
+    """Isolate the shared bundle cache between tests."""
+    shared._shared_clients.clear()
+    yield
+    shared._shared_clients.clear()
+
+
+def test_same_connection_settings_share_clients():
+    """Test that equal connection settings reuse one bundle."""
+    first = get_legend_clients(Settings(sdlc_url="http://sdlc:6100"))
+    second = get_legend_clients(Settings(sdlc_url="http://sdlc:6100"))
+    other = get_legend_clients(Settings(sdlc_url="http://other-sdlc:6100"))
+    
+    assert first is second
+    assert other is not first
+    assert other.sdlc.base_url == "http://other-sdlc:6100"
+
+
+def test_orchestrators_share_clients():
+    """Test that orchestrators reuse the shared bundle."""
+    settings = Settings(engine_url="http://engine:6300")
+    
+    first = AgentOrchestrator(settings)
+    second = AgentOrchestrator(Settings(engine_url="http://engine:6300"))
+    
+    assert first.engine_client is second.engine_client
+    assert first.sdlc_client is get_legend_clients(settings).sdlc
+    assert first.depot_client is get_legend_clients(settings).depot
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "dependency, attribute",
+    [
+        (get_depot_client, "depot"),
+        (get_sdlc_client, "sdlc"),
+        (get_engine_client, "engine"),
+    ],
+)
+async def test_client_dependency_is_shared(dependency, attribute):
+    """Test that each client dependency hands out the shared client."""
+    settings = Settings(engine_url="http://engine:6300")
+    
+    first = await dependency(settings)
+    second = await dependency(Settings(engine_url="http://engine:6300"))
+    
+    assert first is second
+    assert first is getattr(get_legend_clients(settings), attribute)
+
+
+@pytest.mark.asyncio
+async def test_close_legend_clients():
+    """Test that closing releases every bundle."""
+    clients = get_legend_clients(Settings())
+    
+    with patch.object(clients, 'aclose', new_callable=AsyncMock) as mock_close:
+        await close_legend_clients()
+        
+        mock_close.assert_awaited_once()
+    
+    assert get_legend_clients(Settings()) is not clients